@@ -7,6 +7,7 @@ from pydantic import BaseModel
 import logging
 from contextlib import asynccontextmanager
 import asyncio
+import aiohttp
 
 from database.db import SessionLocal
 from database.models import Feed, FeedEntry
@@ -22,10 +23,13 @@ async def lifespan(app: FastAPI):
     global mcp
     mcp = FastApiMCP(app)
     mcp.mount()
+    # One HTTP session for feed downloads, so updates reuse pooled connections
+    app.state.http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=100))
     await asyncio.sleep(1)  # Give MCP time to fully initialize
     logger.info("MCP server initialization complete")
     yield
     # Cleanup (if needed)
+    await app.state.http.close()
     logger.info("Shutting down MCP server")
 
 app = FastAPI(
@@ -87,7 +91,8 @@ async def update_feed(feed_id: int, db: Session = Depends(get_db)):
     
     fetcher = RSSFetcher()
     try:
-        updated_feed = fetcher.fetch_feed(feed.url)
+        # Download on the event loop and parse/store in the executor, so other requests keep being served
+        updated_feed = await fetcher.fetch_feed_async(app.state.http, feed.url)
         if updated_feed:
             db.merge(updated_feed)
             db.commit()
@@ -108,9 +113,10 @@ async def get_feed_entries(
     if not feed:
         raise HTTPException(status_code=404, detail="Feed not found")
     
-    entries = db.query(FeedEntry).filter(
+    # Only the listed columns, streamed in batches since `limit` is caller-controlled
+    entries = db.query(FeedEntry.title, FeedEntry.link, FeedEntry.published_date).filter(
         FeedEntry.feed_id == feed_id
-    ).order_by(FeedEntry.published_date.desc()).limit(limit).all()
+    ).order_by(FeedEntry.published_date.desc()).limit(limit).yield_per(500)
     
     return [{"title": e.title, "link": e.link, "published_date": e.published_date} for e in entries]
 
@@ -137,7 +143,7 @@ async def get_feed_summary(feed_id: int, db: Session = Depends(get_db)):
         if not feed:
             raise HTTPException(status_code=404, detail="Feed not found")
         
-        entries = db.query(FeedEntry).filter(
+        entries = db.query(FeedEntry.title, FeedEntry.link, FeedEntry.published_date).filter(
             FeedEntry.feed_id == feed_id
         ).order_by(FeedEntry.published_date.desc()).limit(5).all()
         
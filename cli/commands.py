@@ -1,30 +1,119 @@
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.style import Style
+from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from database.db import SessionLocal
+from database.db import get_db_session
 from database.models import Feed as DBFeed
-from rss.feeds import get_all_feeds, get_feeds_by_category, get_available_categories, Feed, update_feed_categories, _load_feeds, get_feed_by_name, FEED_CATEGORIES
-from rss.rss_fetcher import RSSFetcher
-from rss.opml_handler import parse_opml, merge_feeds
+from rss.feeds import get_all_feeds, get_feeds_by_category, get_available_categories, Feed, update_feed_categories, _load_feeds, get_feed_by_name, get_category_by_url
 from datetime import datetime
-from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+import asyncio
+import queue
+import threading
 from config import config
 
 # Initialize rich console
 console = Console()
 
-@contextmanager
-def get_db_session():
-    """Create a new database session."""
-    db = SessionLocal()
+# Maximum number of feed downloads in flight at once
+FETCH_CONCURRENCY = 50
+
+def _fetch_feeds_concurrently(feeds, progress, debug: bool = False):
+    """
+    Fetch feeds concurrently, yielding (feed, fetcher, result, error) as each one completes.
+    
+    Downloads share one aiohttp session on an event loop in a daemon thread; parsing,
+    embedding and storage run on that loop's executor, sized by config.rss.fetch_workers.
+    Each feed gets its own RSSFetcher so the per-fetch entry counters are not shared.
+    A spinner is shown for each fetch while it is in flight. Closing the generator
+    (use contextlib.closing) cancels the fetches that have not finished.
+    """
+    import aiohttp
+    from rss.rss_fetcher import RSSFetcher
+    
+    completed = queue.Queue()
+    executor = ThreadPoolExecutor(max_workers=max(1, config.rss.fetch_workers))
+    
+    async def fetch_all():
+        asyncio.get_running_loop().set_default_executor(executor)
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+        
+        async def fetch_one(session, feed):
+            fetcher = RSSFetcher(
+                debug=debug,
+                max_entries=config.rss.max_entries_per_feed,
+                max_age_hours=config.rss.max_age_hours
+            )
+            async with semaphore:
+                task_id = progress.add_task(f"Fetching: {feed.name}")
+                try:
+                    result = await fetcher.fetch_feed_async(session, feed.url)
+                    completed.put((feed, task_id, fetcher, result, None))
+                except Exception as e:
+                    completed.put((feed, task_id, None, None, e))
+        
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=100)) as session:
+            await asyncio.gather(*(fetch_one(session, feed) for feed in feeds))
+    
+    loop = asyncio.new_event_loop()
+    main_task = loop.create_task(fetch_all())
+    done = Future()
+    
+    def run():
+        try:
+            loop.run_until_complete(main_task)
+            done.set_result(None)
+        except BaseException as e:
+            done.set_exception(e)
+        finally:
+            loop.close()
+    
+    # A daemon thread, so an interrupted command doesn't wait on the loop at exit
+    threading.Thread(target=run, name="feed-fetch", daemon=True).start()
     try:
-        yield db
+        for _ in feeds:
+            while True:
+                try:
+                    feed, task_id, fetcher, result, error = completed.get(timeout=0.1)
+                    break
+                except queue.Empty:
+                    if done.done():
+                        # The loop stopped before reporting every feed; surface its error
+                        done.result()
+                        return
+            progress.remove_task(task_id)
+            yield feed, fetcher, result, error
+        done.result()
     finally:
-        db.close()
+        if not done.done():
+            # Stopped early (Ctrl-C, an error in the caller): cancel the outstanding fetches
+            # and drop queued parsing work instead of waiting for every feed
+            try:
+                loop.call_soon_threadsafe(main_task.cancel)
+            except RuntimeError:
+                pass  # The loop finished in the meantime
+        executor.shutdown(wait=False, cancel_futures=True)
+
+# Label spans are built once at import; format_feed_info only appends plain values,
+# so feed titles and descriptions are never run through the markup parser
+_HDR_FEED = Text("Feed: ", style="bold cyan")
+_HDR_URL = Text("URL: ", style="bold blue")
+_HDR_DESCRIPTION = Text("Description: ", style="bold magenta")
+_HDR_UPDATED = Text("Last Updated: ", style="bold green")
+_HDR_ADDED = Text("Entries Added: ", style="bold yellow")
+_HDR_SKIPPED = Text("Entries Skipped: ", style="bold yellow")
+_HDR_ENTRIES = Text("Latest entries", style="bold yellow")
+
+def _format_timestamp(value: datetime) -> str:
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS'"""
+    # isoformat skips strftime's format-string parsing; the slice drops any UTC offset
+    return value.isoformat(sep=' ', timespec='seconds')[:19]
 
 def format_feed_info(feed, entries=None, entries_added=None, entries_skipped=None):
-    """Format feed information for display"""
+    """Format feed information for display as a Rich Text renderable"""
     # Handle both Feed and DBFeed objects
     if isinstance(feed, Feed):
         name = feed.name
@@ -37,27 +126,40 @@ def format_feed_info(feed, entries=None, entries_added=None, entries_skipped=Non
         description = feed.description or "No description"
         last_updated = feed.last_updated
     
-    info = [
-        f"[bold cyan]Feed:[/bold cyan] {name}",
-        f"[bold blue]URL:[/bold blue] {url}",
-        f"[bold magenta]Description:[/bold magenta] {description}",
-        f"[bold green]Last Updated:[/bold green] {last_updated.strftime('%Y-%m-%d %H:%M:%S') if last_updated else 'Never'}"
-    ]
+    info = Text()
+    info.append_text(_HDR_FEED)
+    info.append(f"{name}\n")
+    info.append_text(_HDR_URL)
+    info.append(f"{url}\n")
+    info.append_text(_HDR_DESCRIPTION)
+    info.append(f"{description}\n")
+    info.append_text(_HDR_UPDATED)
+    info.append(_format_timestamp(last_updated) if last_updated else 'Never')
 
     # Add entries stats if provided
     if entries_added is not None:
-        info.append(f"[bold yellow]Entries Added:[/bold yellow] {entries_added}")
+        info.append("\n")
+        info.append_text(_HDR_ADDED)
+        info.append(str(entries_added))
     if entries_skipped is not None:
-        info.append(f"[bold yellow]Entries Skipped:[/bold yellow] {entries_skipped}")
+        info.append("\n")
+        info.append_text(_HDR_SKIPPED)
+        info.append(str(entries_skipped))
     
     if entries:
-        info.append(f"\n[bold yellow]Latest entries[/bold yellow] ({len(entries)}):")
+        info.append("\n\n")
+        info.append_text(_HDR_ENTRIES)
+        info.append(f" ({len(entries)}):")
+        append = info.append
         for entry in entries:
-            info.append(f"[bold]- {entry.title}[/bold]")
-            info.append(f"  [dim]Published: {entry.published_date.strftime('%Y-%m-%d %H:%M:%S') if entry.published_date else 'Unknown'}[/dim]")
-            info.append(f"  [blue link={entry.link}]Link[/blue]\n")
+            published_date = entry.published_date
+            published = _format_timestamp(published_date) if published_date else 'Unknown'
+            append(f"\n- {entry.title}", style="bold")
+            append(f"\n  Published: {published}\n  ", style="dim")
+            append("Link", style=Style(color="blue", link=entry.link))
+            append("\n")
     
-    return "\n".join(info)
+    return info
 
 def display_categories():
     """Display available categories in a table"""
@@ -87,17 +189,19 @@ def display_feeds():
     table.add_column("Last Updated", style="yellow")
     
     with get_db_session() as db:
-        feeds = db.query(DBFeed).all()
+        # Select only the displayed columns so the feed embeddings are never loaded,
+        # and stream them in batches rather than materializing the whole result
+        rows = db.query(
+            DBFeed.name, DBFeed.url, DBFeed.description, DBFeed.category, DBFeed.last_updated
+        ).yield_per(100)
         
-        for feed in feeds:
-            last_updated = feed.last_updated.strftime("%Y-%m-%d %H:%M") if feed.last_updated else "Never"
-            
+        for name, url, description, category, last_updated in rows:
             table.add_row(
-                feed.name or "No Name",
-                feed.url,
-                feed.description[:50] + "..." if feed.description and len(feed.description) > 50 else (feed.description or "No Description"),
-                feed.category.upper() if feed.category else "Unknown",
-                last_updated
+                name or "No Name",
+                url,
+                description[:50] + "..." if description and len(description) > 50 else (description or "No Description"),
+                category.upper() if category else "Unknown",
+                last_updated.strftime("%Y-%m-%d %H:%M") if last_updated else "Never"
             )
     
     console.print(table)
@@ -110,20 +214,12 @@ def update_feeds_from_json(debug: bool = False):
     
     json_feed_urls = {feed.url for feed in all_feeds}
     
-    # Get category mapping
-    feed_categories = {}
-    categories_to_remove = set()
-    
-    for category, feeds in FEED_CATEGORIES.items():
-        for feed in feeds:
-            feed_categories[feed.url] = category
-    
     changes_made = False
     with get_db_session() as db:
         # Check for categories to remove
         db_feeds = db.query(DBFeed).all()
         db_categories = {feed.category for feed in db_feeds if feed.category}
-        json_categories = set(FEED_CATEGORIES.keys())
+        json_categories = set(get_available_categories())
         
         # Find categories that exist in db but not in json
         removed_categories = db_categories - json_categories
@@ -153,7 +249,7 @@ def update_feeds_from_json(debug: bool = False):
                     existing_feed.name = feed.name
                     update_needed = True
                 
-                category = feed_categories.get(feed.url)
+                category = get_category_by_url(feed.url)
                 if existing_feed.category != category:
                     console.print(f"[cyan]Updating feed category for '{feed.name}':[/cyan] {existing_feed.category or 'None'} -> {category}")
                     existing_feed.category = category
@@ -166,7 +262,7 @@ def update_feeds_from_json(debug: bool = False):
                 new_feed = DBFeed(
                     url=feed.url,
                     name=feed.name,
-                    category=feed_categories.get(feed.url),
+                    category=get_category_by_url(feed.url),
                     last_updated=datetime.now()
                 )
                 db.add(new_feed)
@@ -180,6 +276,8 @@ def update_feeds_from_json(debug: bool = False):
 
 def add_feeds(category: str = None, debug: bool = False):
     """Interactive function to add feeds to feeds.json and database"""
+    from rss.rss_fetcher import RSSFetcher
+    
     fetcher = RSSFetcher(debug=debug)
     console = Console()
     
@@ -252,16 +350,12 @@ def add_feeds(category: str = None, debug: bool = False):
 
 def fetch_category_feeds(category: str, debug: bool = False):
     """Fetch latest content for all feeds in a specific category"""
-    if category not in get_available_categories():
+    categories = get_available_categories()
+    if category not in categories:
         console.print(f"[bold red]Error:[/bold red] Category '{category}' not found.")
-        console.print("Available categories:", ", ".join(get_available_categories()))
+        console.print("Available categories:", ", ".join(categories))
         return
     
-    fetcher = RSSFetcher(
-        debug=debug,
-        max_entries=config.rss.max_entries_per_feed,
-        max_age_hours=config.rss.max_age_hours
-    )
     console.print(f"\n[bold cyan]Fetching latest content for feeds in category:[/bold cyan] {category}")
     feeds_to_update = get_feeds_by_category(category)
     
@@ -270,30 +364,27 @@ def fetch_category_feeds(category: str, debug: bool = False):
         TextColumn("[progress.description]{task.description}"),
         console=console
     ) as progress:
-        for feed in feeds_to_update:
-            task_id = progress.add_task(f"Fetching: {feed.name}")
-            try:
-                result = fetcher.fetch_feed(feed.url)
-                if result:
-                    with get_db_session() as db:
+        # One session for the whole loop; it only reloads fetched feeds for display
+        with get_db_session() as db:
+            with closing(_fetch_feeds_concurrently(feeds_to_update, progress, debug)) as fetched:
+                for feed, fetcher, result, error in fetched:
+                    if error:
+                        console.print(f"[bold red]Error fetching {feed.name}:[/bold red] {str(error)}")
+                    elif result:
                         db_feed = db.merge(result)
                         console.print(Panel(format_feed_info(
                             db_feed,
                             entries_added=fetcher.entries_added,
                             entries_skipped=fetcher.entries_skipped
                         ), title=feed.name, border_style="green"))
-                else:
-                    console.print(f"[bold red]Failed to fetch feed:[/bold red] {feed.name}")
-            except Exception as e:
-                console.print(f"[bold red]Error fetching {feed.name}:[/bold red] {str(e)}")
-            finally:
-                progress.remove_task(task_id)
+                    else:
+                        console.print(f"[bold red]Failed to fetch feed:[/bold red] {feed.name}")
 
 def import_opml(file_path: str, debug: bool = False):
     """Import feeds from OPML file"""
+    from rss.opml_handler import parse_opml, merge_feeds
+    
     try:
-        fetcher = RSSFetcher(debug=debug)
-        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -306,24 +397,26 @@ def import_opml(file_path: str, debug: bool = False):
             progress.remove_task(task_id)
             
             console.print("\n[bold cyan]Adding new feeds to database...[/bold cyan]")
-            for category, feeds in merged_feeds.items():
-                for feed in feeds:
-                    task_id = progress.add_task(f"Processing: {feed.name}")
-                    try:
-                        with get_db_session() as db:
-                            existing = db.query(DBFeed).filter(DBFeed.url == feed.url).first()
-                            if not existing:
-                                result = fetcher.fetch_feed(feed.url)
-                                if result:
-                                    with get_db_session() as db:
-                                        db_feed = db.merge(result)
-                                        console.print(Panel(format_feed_info(db_feed), title=feed.name, border_style="green"))
-                                else:
-                                    console.print(f"[yellow]Could not fetch feed:[/yellow] {feed.name}")
-                    except Exception as e:
-                        console.print(f"[red]Error processing {feed.name}:[/red] {str(e)}")
-                    finally:
-                        progress.remove_task(task_id)
+            # Only feeds not yet in the database are fetched; check them all in one IN query
+            all_feeds = [feed for feeds in merged_feeds.values() for feed in feeds]
+            with get_db_session() as db:
+                existing_urls = {
+                    url for (url,) in db.query(DBFeed.url).filter(
+                        DBFeed.url.in_({feed.url for feed in all_feeds})
+                    )
+                }
+            new_db_feeds = [feed for feed in all_feeds if feed.url not in existing_urls]
+            
+            with get_db_session() as db:
+                with closing(_fetch_feeds_concurrently(new_db_feeds, progress, debug)) as fetched:
+                    for feed, fetcher, result, error in fetched:
+                        if error:
+                            console.print(f"[red]Error processing {feed.name}:[/red] {str(error)}")
+                        elif result:
+                            db_feed = db.merge(result)
+                            console.print(Panel(format_feed_info(db_feed), title=feed.name, border_style="green"))
+                        else:
+                            console.print(f"[yellow]Could not fetch feed:[/yellow] {feed.name}")
             
             console.print("\n[bold green]OPML import complete![/bold green]")
             display_categories()
@@ -332,6 +425,8 @@ def import_opml(file_path: str, debug: bool = False):
 
 def fetch_single_feed(feed_name: str, debug: bool = False):
     """Fetch latest content for a specific feed by name"""
+    from rss.rss_fetcher import RSSFetcher
+    
     fetcher = RSSFetcher(
         debug=debug,
         max_entries=config.rss.max_entries_per_feed,
@@ -365,11 +460,6 @@ def fetch_single_feed(feed_name: str, debug: bool = False):
 
 def fetch_all_feeds(debug: bool = False):
     """Fetch latest content for all feeds in the system"""
-    fetcher = RSSFetcher(
-        debug=debug,
-        max_entries=config.rss.max_entries_per_feed,
-        max_age_hours=config.rss.max_age_hours
-    )
     console.print("\n[bold cyan]Fetching latest content for all feeds[/bold cyan]")
     feeds_to_update = get_all_feeds()
     
@@ -378,20 +468,17 @@ def fetch_all_feeds(debug: bool = False):
         TextColumn("[progress.description]{task.description}"),
         console=console
     ) as progress:
-        for feed in feeds_to_update:
-            task_id = progress.add_task(f"Fetching: {feed.name}")
-            try:
-                result = fetcher.fetch_feed(feed.url)
-                if result:
-                    with get_db_session() as db:
+        # One session for the whole loop; it only reloads fetched feeds for display
+        with get_db_session() as db:
+            with closing(_fetch_feeds_concurrently(feeds_to_update, progress, debug)) as fetched:
+                for feed, fetcher, result, error in fetched:
+                    if error:
+                        console.print(f"[bold red]Error fetching {feed.name}:[/bold red] {str(error)}")
+                    elif result:
                         db_feed = db.merge(result)
                         # Get the entries_added and entries_skipped from the fetcher
                         entries_added = getattr(fetcher, 'entries_added', 0)
                         entries_skipped = getattr(fetcher, 'entries_skipped', 0)
                         console.print(Panel(format_feed_info(db_feed, entries_added=entries_added, entries_skipped=entries_skipped), title=feed.name, border_style="green"))
-                else:
-                    console.print(f"[bold red]Failed to fetch feed:[/bold red] {feed.name}")
-            except Exception as e:
-                console.print(f"[bold red]Error fetching {feed.name}:[/bold red] {str(e)}")
-            finally:
-                progress.remove_task(task_id) 
\ No newline at end of file
+                    else:
+                        console.print(f"[bold red]Failed to fetch feed:[/bold red] {feed.name}") 
\ No newline at end of file
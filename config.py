@@ -13,6 +13,8 @@ class OllamaConfig:
     base_url: str = os.getenv("OLLAMA_BASE_URL", "http://127.0.0.1:11434")
     chat_model: str = os.getenv("CHAT_MODEL_NAME", "qwen3:14b")
     embedding_model: str = os.getenv("EMBEDDING_MODEL_NAME", "nomic-embed-text")
+    # Number of texts sent to the embedding model per request
+    embed_batch_size: int = int(os.getenv("EMBED_BATCH_SIZE", "32"))
 
 @dataclass
 class RSSConfig:
@@ -20,6 +22,12 @@ class RSSConfig:
     max_age_hours: int = int(os.getenv("RSS_MAX_AGE_HOURS", "24"))
     # Maximum number of entries to fetch per feed
     max_entries_per_feed: int = int(os.getenv("RSS_MAX_ENTRIES_PER_FEED", "10"))
+    # Number of feeds fetched concurrently by bulk fetch commands
+    fetch_workers: int = int(os.getenv("RSS_FETCH_WORKERS", "10"))
+    # Treat feeds as newest-first and stop reading a feed at its first entry past the age limit
+    assume_sorted: bool = os.getenv("RSS_ASSUME_SORTED", "true").lower() in ("1", "true", "yes")
+    # Send stored ETag/Last-Modified validators so unchanged feeds answer 304 Not Modified
+    conditional_fetch: bool = True
     # Path to feeds configuration file
     feeds_file: str = os.getenv("RSS_FEEDS_FILE", "feeds.json")
 
@@ -1,14 +1,82 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
+from contextlib import contextmanager
 from sqlalchemy.ext.declarative import declarative_base
 from config import config
 
-engine = create_engine(config.db.url)
+# Bulk fetches store feeds from rss.fetch_workers threads at once, each with its own
+# session; size the pool so they don't queue for connections. Pre-ping and recycling
+# keep the long-running MCP server from handing out connections the server dropped
+engine = create_engine(
+    config.db.url,
+    pool_size=max(5, config.rss.fetch_workers),
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# For read-only lookups: loaded objects stay usable after the session ends
+ReadSessionLocal = sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
 
 def init_db():
     from database.models import Base
+    # Extensions must exist before create_all builds the halfvec columns and trigram index
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
+    # create_all does not alter existing tables, so add columns introduced later by hand
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE feeds ADD COLUMN IF NOT EXISTS embedding halfvec(768)"))
+        conn.execute(text("ALTER TABLE feeds ADD COLUMN IF NOT EXISTS etag VARCHAR"))
+        conn.execute(text("ALTER TABLE feeds ADD COLUMN IF NOT EXISTS last_modified VARCHAR"))
+        # Indexes on existing tables are skipped by create_all too
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS feeds_name_trgm_idx ON feeds USING gin (name gin_trgm_ops)"
+        ))
+        # Embeddings are stored in half precision; convert columns created as vector(768)
+        for table, index in (("feeds", "feeds_embedding_hnsw_idx"),
+                             ("feed_entries", "feed_entries_embedding_hnsw_idx")):
+            column_type = conn.execute(text(
+                "SELECT udt_name FROM information_schema.columns "
+                "WHERE table_name = :table AND column_name = 'embedding'"
+            ), {"table": table}).scalar()
+            if column_type == "vector":
+                conn.execute(text(f"DROP INDEX IF EXISTS {index}"))
+                conn.execute(text(
+                    f"ALTER TABLE {table} ALTER COLUMN embedding "
+                    f"TYPE halfvec(768) USING embedding::halfvec(768)"
+                ))
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {index} ON {table} "
+                f"USING hnsw (embedding halfvec_l2_ops)"
+            ))
+        has_preview = conn.execute(text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'feed_entries' AND column_name = 'content_preview'"
+        )).first()
+        if not has_preview:
+            # Backfill previews once, when the column is first added
+            conn.execute(text("ALTER TABLE feed_entries ADD COLUMN content_preview VARCHAR(210)"))
+            conn.execute(text(
+                "UPDATE feed_entries SET content_preview = CASE WHEN length(content) > 200 "
+                "THEN substr(content, 1, 200) || '...' ELSE content END"
+            ))
+        has_content_hash = conn.execute(text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'feed_entries' AND column_name = 'content_hash'"
+        )).first()
+        if not has_content_hash:
+            # Backfill hashes once, when the column is first added; md5 matches _content_hash
+            conn.execute(text("ALTER TABLE feed_entries ADD COLUMN content_hash VARCHAR(32)"))
+            conn.execute(text("UPDATE feed_entries SET content_hash = md5(title || ' ' || content)"))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_feed_entries_content_hash ON feed_entries (content_hash)"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_feed_entries_feed_id_published_date "
+            "ON feed_entries (feed_id, published_date DESC)"
+        ))
 
 def drop_db():
     from database.models import Base
@@ -19,4 +87,22 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+@contextmanager
+def get_db_session():
+    """Create a new database session."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@contextmanager
+def get_read_session():
+    """Create a session for read-only queries."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,6 +1,9 @@
 -- Enable the vector extension
 CREATE EXTENSION IF NOT EXISTS vector;
 
+-- Enable trigram matching for ILIKE '%...%' searches on feed names
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Create feeds table
 CREATE TABLE IF NOT EXISTS feeds (
     id SERIAL PRIMARY KEY,
@@ -8,24 +11,51 @@ CREATE TABLE IF NOT EXISTS feeds (
     name VARCHAR,
     description TEXT,
     last_updated TIMESTAMP WITH TIME ZONE,
-    category VARCHAR
+    category VARCHAR,
+    etag VARCHAR,
+    last_modified VARCHAR,
+    embedding halfvec(768)
 );
 
--- Create feed_entries table with vector support
+-- Databases created before feed embeddings existed
+ALTER TABLE feeds ADD COLUMN IF NOT EXISTS embedding halfvec(768);
+
+-- Databases created before conditional fetches
+ALTER TABLE feeds ADD COLUMN IF NOT EXISTS etag VARCHAR;
+ALTER TABLE feeds ADD COLUMN IF NOT EXISTS last_modified VARCHAR;
+
+-- Create feed_entries table with vector support (half-precision embeddings)
 CREATE TABLE IF NOT EXISTS feed_entries (
     id SERIAL PRIMARY KEY,
     feed_id INTEGER REFERENCES feeds(id),
     title VARCHAR,
     content TEXT,
+    content_preview VARCHAR(210),
     link VARCHAR,
     published_date TIMESTAMP WITH TIME ZONE,
-    embedding vector(768),
+    content_hash VARCHAR(32),
+    embedding halfvec(768),
     CONSTRAINT uix_feed_entry_link UNIQUE (feed_id, link)
 );
 
+-- Databases created before content previews were stored
+ALTER TABLE feed_entries ADD COLUMN IF NOT EXISTS content_preview VARCHAR(210);
+UPDATE feed_entries
+SET content_preview = CASE WHEN length(content) > 200 THEN substr(content, 1, 200) || '...' ELSE content END
+WHERE content_preview IS NULL AND content IS NOT NULL;
+
+-- Databases created before entry content hashes were stored
+ALTER TABLE feed_entries ADD COLUMN IF NOT EXISTS content_hash VARCHAR(32);
+UPDATE feed_entries
+SET content_hash = md5(title || ' ' || content)
+WHERE content_hash IS NULL;
+
 -- Create HNSW index for vector similarity search
 CREATE INDEX IF NOT EXISTS feed_entries_embedding_hnsw_idx ON feed_entries 
-USING hnsw (embedding vector_l2_ops);
+USING hnsw (embedding halfvec_l2_ops);
+
+CREATE INDEX IF NOT EXISTS feeds_embedding_hnsw_idx ON feeds 
+USING hnsw (embedding halfvec_l2_ops);
 
 -- Set default HNSW search parameters
 ALTER DATABASE rss_db SET hnsw.ef_search = 100;
@@ -35,4 +65,16 @@ CREATE INDEX IF NOT EXISTS idx_feed_entries_published_date
 ON feed_entries (published_date DESC);
 
 CREATE INDEX IF NOT EXISTS idx_feeds_category 
-ON feeds (category); 
\ No newline at end of file
+ON feeds (category);
+
+-- Per-feed entry listings (WHERE feed_id = ? ORDER BY published_date DESC LIMIT k)
+CREATE INDEX IF NOT EXISTS idx_feed_entries_feed_id_published_date
+ON feed_entries (feed_id, published_date DESC);
+
+-- Embedding reuse lookups by entry content hash
+CREATE INDEX IF NOT EXISTS idx_feed_entries_content_hash
+ON feed_entries (content_hash);
+
+-- Trigram index so partial feed name matches (ILIKE '%query%') avoid a sequential scan
+CREATE INDEX IF NOT EXISTS feeds_name_trgm_idx
+ON feeds USING gin (name gin_trgm_ops);
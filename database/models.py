@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, create_engine, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, create_engine, UniqueConstraint, Index
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.dialects.postgresql import ARRAY
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 
 Base = declarative_base()
 
@@ -14,7 +14,19 @@ class Feed(Base):
     description = Column(Text)
     last_updated = Column(DateTime)
     category = Column(String)
+    # Cache validators from the last successful fetch, sent back for conditional GETs
+    etag = Column(String)
+    last_modified = Column(String)
+    # Embedding of the feed name and description, refreshed when either changes.
+    # Embeddings are stored in half precision, halving their size on disk and in the index
+    embedding = Column(HALFVEC(768))
     entries = relationship('FeedEntry', back_populates='feed')
+    
+    __table_args__ = (
+        # Trigram index so `name ILIKE '%query%'` lookups can use an index scan
+        Index('feeds_name_trgm_idx', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('feeds_embedding_hnsw_idx', 'embedding', postgresql_using='hnsw', postgresql_ops={'embedding': 'halfvec_l2_ops'}),
+    )
 
 class FeedEntry(Base):
     __tablename__ = 'feed_entries'
@@ -23,12 +35,20 @@ class FeedEntry(Base):
     feed_id = Column(Integer, ForeignKey('feeds.id'))
     title = Column(String)
     content = Column(Text)
+    # First 200 characters of content (plus "..." when truncated), stored at ingest time
+    content_preview = Column(String(210))
     link = Column(String)
     published_date = Column(DateTime)
-    embedding = Column(Vector(768))
+    # md5 of "title content", so identical entry text can reuse a stored embedding
+    content_hash = Column(String(32))
+    embedding = Column(HALFVEC(768))
     
     feed = relationship('Feed', back_populates='entries')
     
     __table_args__ = (
         UniqueConstraint('feed_id', 'link', name='uix_feed_entry_link'),
-    ) 
\ No newline at end of file
+    )
+
+# Serves "WHERE feed_id = ? ORDER BY published_date DESC LIMIT k" with an ordered index scan
+Index('idx_feed_entries_feed_id_published_date', FeedEntry.feed_id, FeedEntry.published_date.desc())
+Index('idx_feed_entries_content_hash', FeedEntry.content_hash)
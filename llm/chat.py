@@ -1,8 +1,8 @@
 import logging
 import json
 import time  
+import requests
 from typing import List, Optional, Iterator, TypedDict, Annotated, Sequence
-from contextlib import contextmanager
 
 from langchain.agents import Tool
 from langchain_ollama.chat_models import ChatOllama
@@ -22,14 +22,17 @@ from langgraph.graph.message import add_messages
 from config import Config
 from .tools import (
     get_feed_details_tool,
+    get_feed_stats_tool,
     get_category_feeds_tool,
     fetch_feed_tool,
     search_related_feeds_tool,
     find_feeds_tool,
     crawl_url_tool,
-    process_content_tool
+    crawl_urls_tool,
+    process_content_tool,
+    crawl_and_process_tool
 )
-from database.db import SessionLocal
+from database.db import get_db_session
 from langchain_core.prompts import PromptTemplate
 
 logger = logging.getLogger('rss_ai')
@@ -39,30 +42,37 @@ Use them when you need to answer a user's question.
 Answer in the language user used.
 When the user ask about a specific feed ,You need use the find_feeds tool to find the most relevant feeds for the user's question.
 Then you need to use the get_feed_details tool to get the details of the feeds.
+If you only need entry counts or feed metadata, use the get_feed_stats tool instead of get_feed_details.
 When the user ask about a specific topic, you need use the search_related_feeds tool to find the most relevant feeds for the user's question.
 """
 
 class AgentState(TypedDict):
     messages: Annotated[list[BaseMessage], add_messages]
 
+# Minimum interval between flushes of streamed tokens to the terminal (seconds)
+STREAM_FLUSH_INTERVAL = 0.05
+
 class StreamingCallbackHandler(BaseCallbackHandler):
     """Callback handler for streaming output to the console."""
     
     def __init__(self, console: Console):
         self.console = console
+        self._last_flush = 0.0
     
     def on_llm_new_token(self, token: str, **kwargs) -> None:
         """Run on new LLM token. Only available when streaming is enabled."""
-        self.console.print(token, end="")
-
-@contextmanager
-def get_db_session():
-    """Create a new database session."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+        # Tokens are plain model output: write them straight to the console's file
+        # instead of running each one through Rich's markup and render pipeline
+        out = self.console.file
+        out.write(token)
+        now = time.monotonic()
+        if now - self._last_flush >= STREAM_FLUSH_INTERVAL:
+            out.flush()
+            self._last_flush = now
+    
+    def on_llm_end(self, response, **kwargs) -> None:
+        """Flush any tokens still buffered when the LLM finishes."""
+        self.console.file.flush()
 
 class RSSChat:
     def __init__(self, config: Config, debug: bool = False):
@@ -91,11 +101,14 @@ class RSSChat:
         self.tools: List[Tool] = [
             find_feeds_tool,
             get_feed_details_tool,
+            get_feed_stats_tool,
             get_category_feeds_tool,
             fetch_feed_tool,
             search_related_feeds_tool,
             crawl_url_tool,
-            process_content_tool
+            crawl_urls_tool,
+            process_content_tool,
+            crawl_and_process_tool
         ]
         
         self.llm_with_tools = self.llm.bind_tools(self.tools)
@@ -116,6 +129,19 @@ class RSSChat:
 
         self.agent_executor = workflow.compile()
     
+    def warm_up(self) -> None:
+        """Ask Ollama to load the chat model so the first question doesn't pay for it."""
+        # A generate request without a prompt only loads the model into memory
+        try:
+            requests.post(
+                f"{self.config.ollama.base_url}/api/generate",
+                json={"model": self.config.ollama.chat_model},
+                timeout=self.timeout,
+            ).raise_for_status()
+            logger.debug(f"Loaded chat model {self.config.ollama.chat_model}")
+        except requests.RequestException as e:
+            logger.debug(f"Could not preload chat model: {e}")
+    
     def should_continue(self, state: AgentState) -> str:
         if isinstance(state["messages"][-1], AIMessage) and state["messages"][-1].tool_calls:
             return "continue"
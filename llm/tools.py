@@ -1,6 +1,6 @@
 from langchain.tools import Tool, StructuredTool
-from rss.feeds import get_feeds_by_category, get_available_categories, get_feed_by_name, get_all_feeds
-from database.db import SessionLocal
+from rss.feeds import get_feeds_by_category, get_available_categories, get_feed_by_name, get_all_feeds, find_category
+from database.db import get_db_session, get_read_session
 from database.models import Feed as DBFeed, FeedEntry
 from datetime import datetime, timedelta
 from dateutil.parser import parse
@@ -8,13 +8,20 @@ from dateutil.tz import tzutc
 from langchain_ollama import OllamaEmbeddings
 from config import config
 from rss.rss_fetcher import RSSFetcher
-from contextlib import contextmanager
 import logging
-import json
+import orjson
 from crawl4ai import AsyncWebCrawler
 import asyncio
-from pydantic.v1 import BaseModel, Field
-from typing import Optional
+import atexit
+import threading
+import weakref
+import heapq
+import time
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional
+from dataclasses import dataclass
+from collections import OrderedDict, defaultdict
+from sqlalchemy import case, func
 
 # Initialize embeddings model
 embeddings_model = OllamaEmbeddings(
@@ -28,57 +35,59 @@ rss_fetcher = RSSFetcher()
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-@contextmanager
-def get_db_session():
-    """Create a new database session."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def _dumps(obj) -> str:
+    """Serialize a tool response to a JSON string; default=str covers stray datetimes"""
+    return orjson.dumps(obj, default=str).decode()
 
-def get_category_feeds_info(category: str) -> str:
-    """Get information about feeds in a specific category"""
-    with get_db_session() as db:
+def _error_response(error: str, **fields) -> dict:
+    """Build a failed tool response with the given error message and empty result fields"""
+    return {"success": False, "error": error, **fields}
+
+def _error(error: str, **fields) -> str:
+    """Build a failed tool response as a JSON string"""
+    return _dumps(_error_response(error, **fields))
+
+def _get_category_feeds_info(category: str) -> dict:
+    """Get information about feeds in a specific category as a dict"""
+    with get_read_session() as db:
         try:
-            # Get all feeds from database
-            all_feeds = db.query(DBFeed).all()
-            
-            # Get configured categories
-            categories = get_available_categories()
-            
-            # Try to match category (case-insensitive)
-            matched_category = next(
-                (cat for cat in categories if cat.lower() == category.lower()),
-                None
-            )
+            # Match category (case-insensitive) against the configured categories
+            matched_category = find_category(category)
             
             if not matched_category:
-                return json.dumps({
-                    "success": False,
-                    "error": f"Category '{category}' not found",
-                    "available_categories": list(categories)
-                })
+                return _error_response(f"Category '{category}' not found", available_categories=get_available_categories())
             
-            # Filter feeds by category
-            category_feeds = [
-                feed for feed in all_feeds
-                if any(f.url == feed.url for f in get_feeds_by_category(matched_category))
-            ]
+            # Load the category's feeds in one IN query
+            urls = [f.url for f in get_feeds_by_category(matched_category)]
+            category_feeds = db.query(DBFeed).filter(DBFeed.url.in_(urls)).all()
+            
+            # Fetch the 5 most recent entries (last 24 hours) of every feed in one query
+            recent_time = datetime.now() - timedelta(hours=24)  # Last 24 hours
+            ranked = (
+                db.query(
+                    FeedEntry.feed_id,
+                    FeedEntry.title,
+                    FeedEntry.link,
+                    FeedEntry.published_date,
+                    func.row_number().over(
+                        partition_by=FeedEntry.feed_id,
+                        order_by=FeedEntry.published_date.desc()
+                    ).label("rank")
+                )
+                .filter(FeedEntry.feed_id.in_([f.id for f in category_feeds]))
+                .filter(FeedEntry.published_date >= recent_time)
+                .subquery()
+            )
+            recent_entries_by_feed = defaultdict(list)
+            for entry in (
+                db.query(ranked)
+                .filter(ranked.c.rank <= 5)
+                .order_by(ranked.c.feed_id, ranked.c.published_date.desc())
+            ):
+                recent_entries_by_feed[entry.feed_id].append(entry)
             
             feeds_info = []
             for db_feed in category_feeds:
-                # Get recent entries
-                recent_time = datetime.now() - timedelta(hours=24)  # Last 24 hours
-                recent_entries = (
-                    db.query(FeedEntry)
-                    .filter(FeedEntry.feed_id == db_feed.id)
-                    .filter(FeedEntry.published_date >= recent_time)
-                    .order_by(FeedEntry.published_date.desc())
-                    .limit(5)
-                    .all()
-                )
-                
                 feeds_info.append({
                     "name": db_feed.name,
                     "url": db_feed.url,
@@ -91,50 +100,64 @@ def get_category_feeds_info(category: str) -> str:
                             "link": entry.link,
                             "published": entry.published_date.isoformat() if entry.published_date else None
                         }
-                        for entry in recent_entries
+                        for entry in recent_entries_by_feed[db_feed.id]
                     ]
                 })
             
-            return json.dumps({
+            return {
                 "success": True,
                 "category": matched_category,
                 "feeds_count": len(feeds_info),
                 "feeds": feeds_info
-            })
+            }
             
         except Exception as e:
             logger.error(f"Error getting category feeds info: {str(e)}")
-            return json.dumps({
-                "success": False,
-                "error": str(e)
-            })
+            return _error_response(str(e))
 
-def get_feed_details(feed_name: str) -> str:
+def get_category_feeds_info(category: str) -> str:
+    """Get information about feeds in a specific category"""
+    return _dumps(_get_category_feeds_info(category))
+
+# Maximum number of entries listed per time period by get_feed_details
+ENTRIES_PER_PERIOD = 20
+
+# Lookback windows accepted by search_related_feeds' time_filter
+TIME_FILTER_DELTAS = {
+    "24h": timedelta(hours=24),
+    "week": timedelta(days=7),
+    "month": timedelta(days=30)
+}
+
+@dataclass(slots=True)
+class EntrySummary:
+    title: str
+    link: str
+    published: str
+    content_preview: str
+
+def _get_feed_details(feed_name: str, include_entries: bool = True) -> dict:
     """
-    Get detailed information about a specific feed, including all its entries
+    Get detailed information about a specific feed, including its recent entries per time period
     
     Args:
         feed_name: Name of the feed (e.g., "Hacker News", "TechCrunch")
+        include_entries: Whether to list entries; when False only the per-period counts are returned
     
     Returns:
-        JSON string containing:
+        Dict containing:
         - success: bool indicating if the operation was successful
         - error: error message if any
         - feed: detailed feed information and entries
     """
-    with get_db_session() as db:
+    with get_read_session() as db:
         # Clean feed name by removing extra whitespace and newlines
         feed_name = feed_name.strip()
         
         # Get feed configuration
         feed_config = get_feed_by_name(feed_name)
         if not feed_config:
-            error_response = {
-                "success": False,
-                "error": f"Feed '{feed_name}' not found in configuration",
-                "feed": None
-            }
-            return json.dumps(error_response)
+            return _error_response(f"Feed '{feed_name}' not found in configuration", feed=None)
         
         try:
             # Get feed from database
@@ -151,45 +174,65 @@ def get_feed_details(feed_name: str) -> str:
                         "entries": []
                     }
                 }
-                return json.dumps(response)
-            
-            # Get all entries, ordered by publication date
-            entries = (
-                db.query(FeedEntry)
-                .filter(FeedEntry.feed_id == db_feed.id)
-                .order_by(FeedEntry.published_date.desc())
-                .all()
-            )
+                return response
             
-            # Group entries by time period
+            # Time periods as (exclusive lower, inclusive upper) bounds on published_date
             now = datetime.now(tzutc())  # Use UTC timezone
-            entries_by_period = {
-                "last_24h": [],
-                "last_week": [],
-                "last_month": [],
-                "older": []
+            cutoff_24h = now - timedelta(hours=24)
+            cutoff_week = now - timedelta(days=7)
+            cutoff_month = now - timedelta(days=30)
+            period_bounds = {
+                "last_24h": (cutoff_24h, None),
+                "last_week": (cutoff_week, cutoff_24h),
+                "last_month": (cutoff_month, cutoff_week),
+                "older": (None, cutoff_month)
             }
             
-            for entry in entries:
-                if not entry.published_date:
+            # Count entries per time period with a single aggregate query
+            period = case(
+                (FeedEntry.published_date.is_(None), None),
+                (FeedEntry.published_date > period_bounds["last_24h"][0], "last_24h"),
+                (FeedEntry.published_date > period_bounds["last_week"][0], "last_week"),
+                (FeedEntry.published_date > period_bounds["last_month"][0], "last_month"),
+                else_="older"
+            ).label("period")
+            periods = db.query(period).filter(FeedEntry.feed_id == db_feed.id).subquery()
+            period_counts = dict(
+                db.query(periods.c.period, func.count())
+                .group_by(periods.c.period)
+                .all()
+            )
+            
+            # Only fetch rows for non-empty periods, newest first and capped per period.
+            # The stored preview is read instead of content so full article bodies
+            # never leave the database
+            entries_by_period = {}
+            for name, (lower, upper) in period_bounds.items():
+                entries_by_period[name] = []
+                if not include_entries or not period_counts.get(name):
                     continue
-                    
-                age = now - entry.published_date
-                entry_info = {
-                    "title": entry.title,  # Entry title
-                    "link": entry.link,
-                    "published": entry.published_date.isoformat(),
-                    "content_preview": entry.content[:200] + "..." if len(entry.content) > 200 else entry.content
-                }
                 
-                if age < timedelta(hours=24):
-                    entries_by_period["last_24h"].append(entry_info)
-                elif age < timedelta(days=7):
-                    entries_by_period["last_week"].append(entry_info)
-                elif age < timedelta(days=30):
-                    entries_by_period["last_month"].append(entry_info)
-                else:
-                    entries_by_period["older"].append(entry_info)
+                query = (
+                    db.query(
+                        FeedEntry.title,
+                        FeedEntry.link,
+                        FeedEntry.published_date,
+                        FeedEntry.content_preview
+                    )
+                    .filter(FeedEntry.feed_id == db_feed.id)
+                    .filter(FeedEntry.published_date.isnot(None))
+                )
+                if lower is not None:
+                    query = query.filter(FeedEntry.published_date > lower)
+                if upper is not None:
+                    query = query.filter(FeedEntry.published_date <= upper)
+                
+                for title, link, published_date, content_preview in (
+                    query.order_by(FeedEntry.published_date.desc()).limit(ENTRIES_PER_PERIOD)
+                ):
+                    entries_by_period[name].append(
+                        EntrySummary(title, link, published_date.isoformat(), content_preview)
+                    )
             
             feed_info = {
                 "name": feed_config.name,
@@ -197,24 +240,13 @@ def get_feed_details(feed_name: str) -> str:
                 "status": "Active",
                 "description": db_feed.description,
                 "last_updated": db_feed.last_updated.isoformat() if db_feed.last_updated else None,
-                "entries_count": len(entries),
+                "entries_count": sum(period_counts.values()),
                 "entries_by_period": {
-                    "last_24h": {
-                        "count": len(entries_by_period["last_24h"]),
-                        "entries": entries_by_period["last_24h"]
-                    },
-                    "last_week": {
-                        "count": len(entries_by_period["last_week"]),
-                        "entries": entries_by_period["last_week"]
-                    },
-                    "last_month": {
-                        "count": len(entries_by_period["last_month"]),
-                        "entries": entries_by_period["last_month"]
-                    },
-                    "older": {
-                        "count": len(entries_by_period["older"]),
-                        "entries": entries_by_period["older"]
-                    }
+                    name: {
+                        "count": period_counts.get(name, 0),
+                        "entries": period_entries
+                    } if include_entries else {"count": period_counts.get(name, 0)}
+                    for name, period_entries in entries_by_period.items()
                 }
             }
             
@@ -222,23 +254,28 @@ def get_feed_details(feed_name: str) -> str:
                 "success": True,
                 "feed": feed_info
             }
-            return json.dumps(response)
+            return response
             
         except Exception as e:
-            error_response = {
-                "success": False,
-                "error": str(e),
-                "feed": None
-            }
-            return json.dumps(error_response)
+            return _error_response(str(e), feed=None)
+
+def get_feed_details(feed_name: str) -> str:
+    """Get detailed information about a specific feed as a JSON string"""
+    return _dumps(_get_feed_details(feed_name))
+
+def get_feed_stats(feed_name: str) -> str:
+    """Get a feed's metadata and per-period entry counts, without listing entries, as a JSON string"""
+    return _dumps(_get_feed_details(feed_name, include_entries=False))
 
 class SearchFeedsArgs(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     query: str = Field(description="Search query describing the topic of interest (e.g., 'AI research', 'tech news')")
     time_filter: Optional[str] = Field(None, description='Filter feeds by update time ("24h", "week", "month", None for all)')
     sort_by: Optional[str] = Field("relevance", description='How to sort results ("relevance", "recent", "combined")')
     limit: Optional[int] = Field(5, description="Maximum number of results to return")
 
-def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "relevance", limit: int = 5) -> str:
+def _search_related_feeds(query: str, time_filter: str = None, sort_by: str = "relevance", limit: int = 5) -> dict:
     """
     Search for feeds and entries related to the given query using semantic search with advanced filtering
     
@@ -249,21 +286,23 @@ def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "re
         limit: Maximum number of results to return
     
     Returns:
-        JSON string containing:
+        Dict containing:
         - success: bool indicating if the operation was successful
         - error: error message if any
         - feeds: list of related feeds with their recent entries
         - entries: list of directly related entries
         - query: original search query
     """
-    with get_db_session() as db:
+    with get_read_session() as db:
         try:
             # First try to find directly related entries using semantic search
             fetcher = RSSFetcher()
             similar_entries = fetcher.search_similar_entries(query, limit=limit*2)
+            # Feeds whose own name and description match, found with one ANN probe
+            similar_feeds = fetcher.search_similar_feeds(query, limit=limit)
             
-            if not similar_entries:
-                return json.dumps({
+            if not similar_entries and not similar_feeds:
+                return {
                     "success": True,
                     "query": query,
                     "time_filter": time_filter,
@@ -273,33 +312,39 @@ def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "re
                     "entries_found": 0,
                     "entries": [],
                     "message": "No semantically similar entries found"
-                })
+                }
             
-            # Apply time filter if specified
+            # Apply time filter if specified, as a single cutoff computed once per call
             now = datetime.now(tzutc())
-            time_deltas = {
-                "24h": timedelta(hours=24),
-                "week": timedelta(days=7),
-                "month": timedelta(days=30)
-            }
+            delta = TIME_FILTER_DELTAS.get(time_filter) if time_filter else None
+            cutoff = now - delta if delta else None
+            
+            # Load every feed referenced by the results in a single query
+            feeds_by_id = {
+                feed.id: feed
+                for feed in db.query(DBFeed).filter(
+                    DBFeed.id.in_({entry.feed_id for entry in similar_entries})
+                )
+            } if similar_entries else {}
+            for feed in similar_feeds:
+                feeds_by_id.setdefault(feed.id, feed)
             
             # Group entries by feed and calculate feed relevance
             feed_scores = {}
+            feed_match_scores = {}
             entries_by_feed = {}
             feed_last_updated = {}
             
-            for entry in similar_entries:
+            for semantic_position, entry in enumerate(similar_entries):
                 feed_id = entry.feed_id
                 
                 # Get feed and check time filter if specified
-                feed = db.query(DBFeed).filter(DBFeed.id == feed_id).first()
+                feed = feeds_by_id.get(feed_id)
                 if not feed or not feed.last_updated:
                     continue
                     
-                if time_filter:
-                    delta = time_deltas.get(time_filter)
-                    if delta and now - feed.last_updated > delta:
-                        continue
+                if cutoff is not None and feed.last_updated < cutoff:
+                    continue
                 
                 # Initialize feed data
                 if feed_id not in feed_scores:
@@ -315,7 +360,6 @@ def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "re
                     time_score = max(0.5, 1.0 - (age.total_seconds() / (30 * 24 * 3600)) * 0.5)
                 
                 # Entries are already sorted by semantic similarity
-                semantic_position = similar_entries.index(entry)
                 semantic_score = 1.0 - (semantic_position / len(similar_entries))
                 
                 # Combined score weights semantic relevance more heavily
@@ -324,8 +368,24 @@ def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "re
                 feed_scores[feed_id] += combined_score
                 entries_by_feed[feed_id].append((entry, combined_score))
             
+            # Feeds matched directly are included even without matching entries; their
+            # match rank is kept as a separate signal rather than added to the entry scores
+            for feed_position, feed in enumerate(similar_feeds):
+                if not feed.last_updated:
+                    continue
+                    
+                if cutoff is not None and feed.last_updated < cutoff:
+                    continue
+                
+                if feed.id not in feed_scores:
+                    feed_scores[feed.id] = 0
+                    entries_by_feed[feed.id] = []
+                    feed_last_updated[feed.id] = feed.last_updated
+                
+                feed_match_scores[feed.id] = 1.0 - (feed_position / len(similar_feeds))
+            
             if not feed_scores:
-                return json.dumps({
+                return {
                     "success": True,
                     "query": query,
                     "time_filter": time_filter,
@@ -335,7 +395,12 @@ def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "re
                     "entries_found": 0,
                     "entries": [],
                     "message": "No feeds match the time filter criteria"
-                })
+                }
+            
+            # Relevance comes from the matching entries alone; a direct feed match only
+            # breaks ties between feeds with the same entry score
+            entry_count = max(len(similar_entries), 1)
+            relevance = {feed_id: score / entry_count for feed_id, score in feed_scores.items()}
             
             # Sort feeds based on specified criteria
             if sort_by == "recent":
@@ -345,13 +410,14 @@ def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "re
             elif sort_by == "combined":
                 # Combine relevance score with recency
                 sorted_feeds = sorted(feed_scores.keys(),
-                                   key=lambda x: (feed_scores[x] * 0.7 + 
+                                   key=lambda x: ((feed_scores[x] * 0.7 + 
                                                 (1.0 - (now - feed_last_updated[x]).total_seconds() / 
                                                 (30 * 24 * 3600)) * 0.3),
+                                                feed_match_scores.get(x, 0.0)),
                                    reverse=True)
             else:  # default to relevance
                 sorted_feeds = sorted(feed_scores.keys(),
-                                   key=lambda x: feed_scores[x],
+                                   key=lambda x: (relevance[x], feed_match_scores.get(x, 0.0)),
                                    reverse=True)
             
             # Get feed information
@@ -361,7 +427,7 @@ def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "re
             
             # Process feeds in sorted order
             for feed_id in sorted_feeds[:limit]:
-                feed = db.query(DBFeed).filter(DBFeed.id == feed_id).first()
+                feed = feeds_by_id.get(feed_id)
                 if not feed:
                     continue
                 
@@ -375,14 +441,15 @@ def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "re
                     "name": feed.name,
                     "url": feed.url,
                     "description": feed.description,
-                    "relevance_score": round(feed_scores[feed_id] / len(similar_entries), 3),
+                    "relevance_score": round(relevance[feed_id], 3),
+                    "feed_match_score": round(feed_match_scores.get(feed_id, 0.0), 3),
                     "last_updated": feed.last_updated.isoformat() if feed.last_updated else None,
                     "matching_entries": [
                         {
                             "title": entry.title,
                             "link": entry.link,
                             "published": entry.published_date.isoformat() if entry.published_date else None,
-                            "content_preview": entry.content[:200] + "..." if len(entry.content) > 200 else entry.content,
+                            "content_preview": entry.content_preview,
                             "relevance_score": round(score, 3)
                         }
                         for entry, score in sorted_entries[:3]  # Top 3 entries per feed
@@ -395,7 +462,7 @@ def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "re
                         entries_info.append({
                             "title": entry.title,
                             "link": entry.link,
-                            "content_preview": entry.content[:200] + "..." if len(entry.content) > 200 else entry.content,
+                            "content_preview": entry.content_preview,
                             "published": entry.published_date.isoformat() if entry.published_date else None,
                             "relevance_score": round(score, 3),
                             "feed": {
@@ -416,18 +483,15 @@ def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "re
                 "entries_found": len(entries_info),
                 "entries": entries_info
             }
-            return json.dumps(response)
+            return response
             
         except Exception as e:
             logger.error(f"Error in search_related_feeds: {str(e)}")
-            error_response = {
-                "success": False,
-                "error": str(e),
-                "query": query,
-                "feeds": [],
-                "entries": []
-            }
-            return json.dumps(error_response)
+            return _error_response(str(e), query=query, feeds=[], entries=[])
+
+def search_related_feeds(query: str, time_filter: str = None, sort_by: str = "relevance", limit: int = 5) -> str:
+    """Search for feeds and entries related to the given query, returned as a JSON string"""
+    return _dumps(_search_related_feeds(query, time_filter, sort_by, limit))
 
 def fetch_feed_content(feed_name: str) -> str:
     """
@@ -442,69 +506,46 @@ def fetch_feed_content(feed_name: str) -> str:
         - error: error message if any
         - feed: feed information if successful
     """
-    try:
-        # Clean feed name by removing extra whitespace and newlines
-        feed_name = feed_name.strip()
-        
-        feed_config = get_feed_by_name(feed_name)
-        if not feed_config:
-            error_response = {
-                "success": False,
-                "error": f"Feed '{feed_name}' not found in configuration",
-                "feed": None
-            }
-            return json.dumps(error_response)
-        
-        with get_db_session() as db:
-            try:
-                # First try to fetch the feed
-                result = rss_fetcher.fetch_feed(feed_config.url)
-                if not result:
-                    error_response = {
-                        "success": False,
-                        "error": f"Failed to fetch feed: {feed_name}",
-                        "feed": None
-                    }
-                    return json.dumps(error_response)
-                
-                # Make sure the result is bound to our session
-                result = db.merge(result)
-                
-                # Return feed info from the committed object
-                response = {
-                    "success": True,
-                    "feed": {
-                        "name": feed_config.name,
-                        "url": feed_config.url,
-                        "description": result.description,
-                        "last_updated": result.last_updated.isoformat() if result.last_updated else None
-                    }
-                }
-                return json.dumps(response)
-            except Exception as e:
-                logger.error(f"Error in fetch_feed_content: {str(e)}")
-                error_response = {
-                    "success": False,
-                    "error": str(e),
-                    "feed": None
-                }
-                return json.dumps(error_response)
+    # Clean feed name by removing extra whitespace and newlines
+    feed_name = feed_name.strip()
+    
+    feed_config = get_feed_by_name(feed_name)
+    if not feed_config:
+        return _error(f"Feed '{feed_name}' not found in configuration", feed=None)
+    
+    with get_db_session() as db:
+        try:
+            # First try to fetch the feed
+            result = rss_fetcher.fetch_feed(feed_config.url)
+            if not result:
+                return _error(f"Failed to fetch feed: {feed_name}", feed=None)
             
-    except Exception as e:
-        logger.error(f"Error in fetch_feed_content: {str(e)}")
-        error_response = {
-            "success": False,
-            "error": str(e),
-            "feed": None
-        }
-        return json.dumps(error_response)
+            # Make sure the result is bound to our session
+            result = db.merge(result)
+            # Feed names may have changed with the fetch
+            invalidate_find_feeds_cache()
+            
+            # Return feed info from the committed object
+            response = {
+                "success": True,
+                "feed": {
+                    "name": feed_config.name,
+                    "url": feed_config.url,
+                    "description": result.description,
+                    "last_updated": result.last_updated.isoformat() if result.last_updated else None
+                }
+            }
+            return _dumps(response)
+        except Exception as e:
+            logger.error(f"Error in fetch_feed_content: {str(e)}")
+            return _error(str(e), feed=None)
 
-def get_all_categories() -> str:
+def _get_all_categories() -> dict:
     """
     Get a list of all available feed categories
     
     Returns:
-        JSON string containing:
+        Dict containing:
         - success: bool indicating if the operation was successful
         - categories: list of category names and their feed counts
     """
@@ -524,15 +565,14 @@ def get_all_categories() -> str:
             "categories": category_info,
             "total_categories": len(categories)
         }
-        return json.dumps(response)
+        return response
         
     except Exception as e:
-        error_response = {
-            "success": False,
-            "error": str(e),
-            "categories": []
-        }
-        return json.dumps(error_response)
+        return _error_response(str(e), categories=[])
+
+def get_all_categories() -> str:
+    """Get a list of all available feed categories as a JSON string"""
+    return _dumps(_get_all_categories())
 
 # Create the LangChain tools
 get_all_categories_tool = Tool(
@@ -577,7 +617,7 @@ get_feed_details_tool = Tool(
     name="get_feed_details",
     description="""
     Get detailed information about a specific RSS feed by its name.
-    This tool returns comprehensive information about the feed and all its entries.
+    This tool returns comprehensive information about the feed and its entries.
     
     Args:
         feed_name (str): Name of the feed (e.g., "Hacker News", "TechCrunch")
@@ -586,13 +626,30 @@ get_feed_details_tool = Tool(
         Detailed feed information, including:
         - Feed metadata (name, URL, title, description)
         - Last update time
-        - All entries, grouped by time period (24h, week, month, older)
+        - The most recent entries of each time period (24h, week, month, older)
         - Entry counts for each time period
         - Content previews and links
     """,
     func=get_feed_details
 )
 
+get_feed_stats_tool = Tool(
+    name="get_feed_stats",
+    description="""
+    Get metadata and entry counts for a specific RSS feed by its name, without the entries themselves.
+    Prefer this over get_feed_details when you only need to know how many entries a feed has
+    (e.g. "how many posts this week?") or when it was last updated.
+    
+    Args:
+        feed_name (str): Name of the feed (e.g., "Hacker News", "TechCrunch")
+        
+    Returns:
+        Feed metadata (name, URL, description, last update time), the total entry count
+        and the entry count for each time period (24h, week, month, older)
+    """,
+    func=get_feed_stats
+)
+
 search_related_feeds_tool = StructuredTool.from_function(
     func=search_related_feeds,
     name="search_related_feeds",
@@ -635,8 +692,70 @@ fetch_feed_tool = Tool(
     func=fetch_feed_content
 )
 
+# One shared crawler per event loop, so the browser is started once and reused.
+# Sync calls run on the background crawl loop below; async callers (e.g. an async
+# agent) get a crawler on their own loop, since a browser cannot cross loops
+_crawlers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncWebCrawler]" = weakref.WeakKeyDictionary()
+_crawler_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+async def _get_crawler() -> AsyncWebCrawler:
+    """Return the running event loop's shared crawler, starting it on first use"""
+    loop = asyncio.get_running_loop()
+    lock = _crawler_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        crawler = _crawlers.get(loop)
+        if crawler is None:
+            crawler = AsyncWebCrawler()
+            try:
+                await crawler.__aenter__()
+            except Exception:
+                # Don't leave a half-started browser behind; the next call starts afresh
+                await _exit_crawler(crawler)
+                raise
+            _crawlers[loop] = crawler
+        return crawler
+
+async def _exit_crawler(crawler: AsyncWebCrawler) -> None:
+    """Shut down a crawler's browser, ignoring errors from one that has already died"""
+    try:
+        await crawler.__aexit__(None, None, None)
+    except Exception as e:
+        logger.debug(f"Error closing crawler: {str(e)}")
+
+async def _discard_crawler(crawler: AsyncWebCrawler) -> None:
+    """Evict a failed crawler from the cache so the next call starts a new browser"""
+    loop = asyncio.get_running_loop()
+    if _crawlers.get(loop) is crawler:
+        del _crawlers[loop]
+    await _exit_crawler(crawler)
+
+# Long-lived event loop for crawls started from sync code, so the shared crawler
+# survives between calls instead of being torn down with a per-call asyncio.run loop
+_crawl_loop = asyncio.new_event_loop()
+threading.Thread(target=_crawl_loop.run_forever, name="crawl-loop", daemon=True).start()
+
+def _run_crawl(coro):
+    """Run a crawl coroutine on the background crawl loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, _crawl_loop).result()
+
+@atexit.register
+def _shutdown_crawl_loop() -> None:
+    """Close every cached crawler on its own event loop before the interpreter exits"""
+    for loop, crawler in list(_crawlers.items()):
+        _crawlers.pop(loop, None)
+        try:
+            if loop.is_closed():
+                logger.debug("Crawler's event loop already closed; cannot shut it down")
+            elif loop.is_running():
+                # The background crawl loop, or a loop still running in another thread
+                asyncio.run_coroutine_threadsafe(_exit_crawler(crawler), loop).result(timeout=10)
+            else:
+                loop.run_until_complete(asyncio.wait_for(_exit_crawler(crawler), timeout=10))
+        except Exception as e:
+            logger.debug(f"Error closing crawler: {str(e)}")
+
 # New function and tool for crawling URL content
-async def crawl_url_content_async(url: str) -> str:
+async def _crawl_url_content_async(url: str) -> dict:
     """
     Crawl the content of a given URL using Crawl4ai asynchronously.
     
@@ -644,7 +763,7 @@ async def crawl_url_content_async(url: str) -> str:
         url: The URL to crawl
         
     Returns:
-        JSON string containing:
+        Dict containing:
         - success: bool indicating if the operation was successful
         - error: error message if any
         - url: the crawled URL
@@ -653,106 +772,115 @@ async def crawl_url_content_async(url: str) -> str:
         - next_steps: suggested next steps for processing this content
     """
     try:
-        async with AsyncWebCrawler() as crawler:
+        crawler = await _get_crawler()
+        try:
             result = await crawler.arun(url=url, config=None)
-        
-            if result and result.markdown:
-                content = result.markdown
-                
-                # Extract meaningful summary
-                # First try to get the first paragraph that's not too short
-                paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
-                summary = ""
-                
-                # Look for a good first paragraph (at least 50 chars but not too long)
-                for para in paragraphs:
-                    if len(para) >= 50 and len(para) <= 300:
-                        summary = para
-                        break
-                
-                # If no good paragraph found, use smart truncation
-                if not summary:
-                    # Take first paragraph but ensure we don't cut mid-sentence
-                    first_para = paragraphs[0] if paragraphs else content
-                    if len(first_para) > 300:
-                        # Find the last complete sentence within 300 chars
-                        truncated = first_para[:300]
-                        last_period = max(
-                            truncated.rfind('.'),
-                            truncated.rfind('!'),
-                            truncated.rfind('?')
-                        )
-                        if last_period > 50:  # Ensure we have a decent length
-                            summary = first_para[:last_period + 1]
-                        else:
-                            # If no good sentence break, use the first 300 chars
-                            summary = truncated + "..."
+        except Exception:
+            # A crashed browser would fail every later call; start a new one next time
+            await _discard_crawler(crawler)
+            raise
+    
+        if result and result.markdown:
+            content = result.markdown
+            
+            # Extract meaningful summary
+            # First try to get the first paragraph that's not too short
+            paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
+            summary = ""
+            
+            # Look for a good first paragraph (at least 50 chars but not too long)
+            for para in paragraphs:
+                if len(para) >= 50 and len(para) <= 300:
+                    summary = para
+                    break
+            
+            # If no good paragraph found, use smart truncation
+            if not summary:
+                # Take first paragraph but ensure we don't cut mid-sentence
+                first_para = paragraphs[0] if paragraphs else content
+                if len(first_para) > 300:
+                    # Find the last complete sentence within 300 chars
+                    truncated = first_para[:300]
+                    last_period = max(
+                        truncated.rfind('.'),
+                        truncated.rfind('!'),
+                        truncated.rfind('?')
+                    )
+                    if last_period > 50:  # Ensure we have a decent length
+                        summary = first_para[:last_period + 1]
                     else:
-                        summary = first_para
-                
-                # Add content length info to summary
-                summary = f"{summary}\n\nArticle length: {len(content)} characters."
-                
-                response = {
-                    "success": True,
-                    "url": url,
-                    "content": content,  # Keep the full content
-                    "summary": summary,
-                    "next_steps": [
-                        "Review the summary for relevance",
-                        "Use process_long_content tool if you need to focus on specific parts",
-                        "Extract key information based on the user's query"
-                    ]
-                }
-            else:
-                response = {
-                    "success": False,
-                    "error": "Failed to crawl content or content is empty.",
-                    "url": url,
-                    "content": None,
-                    "summary": None,
-                    "next_steps": ["Try an alternative URL", "Report the crawling failure"]
-                }
-            return json.dumps(response)
-        
+                        # If no good sentence break, use the first 300 chars
+                        summary = truncated + "..."
+                else:
+                    summary = first_para
+            
+            # Add content length info to summary
+            summary = f"{summary}\n\nArticle length: {len(content)} characters."
+            
+            response = {
+                "success": True,
+                "url": url,
+                "content": content,  # Keep the full content
+                "summary": summary,
+                "next_steps": [
+                    "Review the summary for relevance",
+                    "Use process_long_content tool if you need to focus on specific parts",
+                    "Extract key information based on the user's query"
+                ]
+            }
+        else:
+            response = {
+                "success": False,
+                "error": "Failed to crawl content or content is empty.",
+                "url": url,
+                "content": None,
+                "summary": None,
+                "next_steps": ["Try an alternative URL", "Report the crawling failure"]
+            }
+        return response
+    
     except Exception as e:
         logger.error(f"Error in crawl_url_content_async for url {url}: {str(e)}")
-        error_response = {
-            "success": False,
-            "error": str(e),
-            "url": url,
-            "content": None,
-            "summary": None,
-            "next_steps": ["Handle the error", "Try an alternative URL"]
-        }
-        return json.dumps(error_response)
+        return _error_response(
+            str(e),
+            url=url,
+            content=None,
+            summary=None,
+            next_steps=["Handle the error", "Try an alternative URL"]
+        )
+
+async def crawl_url_content_async(url: str) -> str:
+    """Crawl the content of a given URL asynchronously, returned as a JSON string."""
+    return _dumps(await _crawl_url_content_async(url))
 
 def crawl_url_content(url: str) -> str:
     """Synchronous wrapper for crawl_url_content_async."""
     try:
-        return asyncio.run(crawl_url_content_async(url))
+        return _run_crawl(crawl_url_content_async(url))
     except Exception as e:
         logger.error(f"Error running async crawl_url_content for {url}: {str(e)}")
-        error_response = {
-            "success": False,
-            "error": f"Asyncio execution error: {str(e)}",
-            "url": url,
-            "content": None,
-            "summary": None,
-            "next_steps": ["Handle the error", "Try an alternative URL"]
-        }
-        return json.dumps(error_response)
+        return _error(
+            f"Asyncio execution error: {str(e)}",
+            url=url,
+            content=None,
+            summary=None,
+            next_steps=["Handle the error", "Try an alternative URL"]
+        )
+
+class CrawlUrlArgs(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-crawl_url_tool = Tool(
+    url: str = Field(description="The direct URL string of the web page to crawl")
+
+# Async agents await the coroutine on their own loop; sync callers go through the crawl loop
+crawl_url_tool = StructuredTool.from_function(
+    func=crawl_url_content,
+    coroutine=crawl_url_content_async,
     name="crawl_url_content",
     description="""
     Crawl the main content of a web page given its URL.
     This tool uses Crawl4ai to extract the article or main content from a URL and returns it in Markdown format.
     
-    IMPORTANT: Input should be a direct URL string, NOT a JSON object.
-    Example: "https://example.com/article" (correct)
-    NOT: {"url": "https://example.com/article"} (wrong)
-    
     The response includes:
     - The main content
     - A brief summary
@@ -770,15 +898,20 @@ crawl_url_tool = Tool(
     Returns:
         A JSON string containing the content, summary, and next steps.
     """,
-    func=crawl_url_content
+    args_schema=CrawlUrlArgs,
 )
 
 class ProcessContentArgs(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     content: str = Field(description="The content to process")
     query: Optional[str] = Field(None, description="Optional query to focus the extraction")
     max_length: int = Field(1000, description="Maximum length of processed content")
 
-def process_long_content(content: str, query: str = None, max_length: int = 1000) -> str:
+# Separator inserted between the head and tail of truncated content
+TRUNCATION_MARKER = "\n\n[...content truncated...]\n\n"
+
+def _process_long_content(content: str, query: str = None, max_length: int = 1000) -> dict:
     """
     Process long content and extract relevant information.
     
@@ -788,63 +921,86 @@ def process_long_content(content: str, query: str = None, max_length: int = 1000
         max_length: Maximum length of processed content
         
     Returns:
-        JSON string containing processed information
+        Dict containing processed information
     """
     try:
         # If content is not too long, return as is
         if len(content) <= max_length:
-            return json.dumps({
+            return {
                 "success": True,
                 "content": content,
                 "is_truncated": False
-            })
+            }
             
         # If we have a query, try to extract relevant sections
         if query:
             # Split content into paragraphs
             paragraphs = content.split('\n\n')
+            terms = [term.lower() for term in query.split()]
             
-            # Score paragraphs based on relevance to query
-            relevant_paragraphs = []
-            for para in paragraphs:
-                # Simple relevance check - can be improved with embeddings
-                if any(term.lower() in para.lower() for term in query.split()):
-                    relevant_paragraphs.append(para)
+            # Score paragraphs by how many query terms they contain
+            # Simple relevance check - can be improved with embeddings
+            scored = (
+                (sum(term in para.lower() for term in terms), -index, para)
+                for index, para in enumerate(paragraphs)
+            )
             
-            # Combine relevant paragraphs up to max_length
-            processed_content = ""
+            # Keep only the k best paragraphs that could fit in the budget,
+            # then restore their original order
+            avg_length = max(1, len(content) // len(paragraphs))
+            top = heapq.nlargest(max_length // avg_length + 5, scored)
+            relevant_paragraphs = [
+                para for score, _, para in sorted(top, key=lambda item: -item[1])
+                if score > 0
+            ]
+            
+            # Combine relevant paragraphs up to max_length, joining once at the end
+            selected = []
+            processed_length = 0
             for para in relevant_paragraphs:
-                if len(processed_content) + len(para) + 2 <= max_length:
-                    processed_content += para + "\n\n"
+                if processed_length + len(para) + 2 <= max_length:
+                    selected.append(para)
+                    processed_length += len(para) + 2
                 else:
                     break
                     
-            return json.dumps({
+            return {
                 "success": True,
-                "content": processed_content.strip(),
+                "content": "\n\n".join(selected).strip(),
                 "is_truncated": True,
                 "original_length": len(content),
-                "processed_length": len(processed_content)
-            })
+                "processed_length": processed_length
+            }
             
         # If no query, take the first and last parts
-        start = content[:max_length//2]
-        end = content[-max_length//2:]
+        half = max_length // 2
+        truncated = "".join((content[:half], TRUNCATION_MARKER, content[-half:] if half else ""))
         
-        return json.dumps({
+        return {
             "success": True,
-            "content": f"{start}\n\n[...content truncated...]\n\n{end}",
+            "content": truncated,
             "is_truncated": True,
             "original_length": len(content),
-            "processed_length": max_length
-        })
+            "processed_length": len(truncated)
+        }
         
     except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": str(e),
-            "content": None
-        })
+        return _error_response(str(e), content=None)
+
+# Pre-serialized envelope for content that fits without truncation
+_SHORT_RESULT_PREFIX = b'{"success":true,"is_truncated":false,"content":'
+
+def process_long_content(content: str, query: str = None, max_length: int = 1000) -> str:
+    """Process long content and extract relevant information, returned as a JSON string."""
+    try:
+        result = _process_long_content(content, query, max_length)
+        if result["success"] and not result["is_truncated"]:
+            # Most RSS content already fits: write it into the pre-serialized envelope
+            return (_SHORT_RESULT_PREFIX + orjson.dumps(content) + b'}').decode()
+        return _dumps(result)
+    except Exception as e:
+        # e.g. orjson rejects strings containing lone surrogates
+        return _error(str(e), content=None)
 
 process_content_tool = StructuredTool.from_function(
     func=process_long_content,
@@ -865,10 +1021,218 @@ process_content_tool = StructuredTool.from_function(
     args_schema=ProcessContentArgs,
 )
 
+# Maximum number of URLs crawled at the same time by the batch tools
+CRAWL_CONCURRENCY = 8
+
+class CrawlUrlsArgs(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    urls: List[str] = Field(description="List of direct URL strings to crawl")
+
+class CrawlAndProcessArgs(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    urls: List[str] = Field(description="List of direct URL strings to crawl")
+    query: Optional[str] = Field(None, description="Optional query to focus the extraction")
+    max_length: int = Field(1000, description="Maximum length of processed content per URL")
+
+async def crawl_many(urls: List[str], concurrency: int = CRAWL_CONCURRENCY) -> List[dict]:
+    """
+    Crawl several URLs concurrently, with at most `concurrency` crawls in flight.
+
+    Args:
+        urls: The URLs to crawl
+        concurrency: Maximum number of simultaneous crawls
+
+    Returns:
+        List of crawl result dicts (as from crawl_url_content), one per URL in input order
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(url: str) -> dict:
+        async with sem:
+            return await _crawl_url_content_async(url)
+
+    results = await asyncio.gather(*(one(url) for url in urls), return_exceptions=True)
+    return [
+        {
+            "success": False,
+            "error": str(result),
+            "url": url,
+            "content": None,
+            "summary": None
+        } if isinstance(result, BaseException) else result
+        for url, result in zip(urls, results)
+    ]
+
+async def crawl_urls_content_async(urls: List[str]) -> str:
+    """Crawl several URLs concurrently, returned as a JSON string."""
+    try:
+        results = await crawl_many(urls)
+        return _dumps({
+            "success": True,
+            "results": results,
+            "total_results": len(results)
+        })
+    except Exception as e:
+        logger.error(f"Error in crawl_urls_content: {str(e)}")
+        return _error(str(e), results=[])
+
+def crawl_urls_content(urls: List[str]) -> str:
+    """Synchronous wrapper for crawl_urls_content_async."""
+    try:
+        return _run_crawl(crawl_urls_content_async(urls))
+    except Exception as e:
+        logger.error(f"Error running async crawl_urls_content: {str(e)}")
+        return _error(f"Asyncio execution error: {str(e)}", results=[])
+
+crawl_urls_tool = StructuredTool.from_function(
+    func=crawl_urls_content,
+    coroutine=crawl_urls_content_async,
+    name="crawl_urls_content",
+    description="""
+    Crawl the main content of several web pages at once.
+    Use this instead of calling crawl_url_content repeatedly when you need
+    the full content of multiple links; the pages are fetched concurrently.
+
+    Args:
+        urls: List of direct URL strings to crawl
+
+    Returns:
+        For each URL, in input order: the same fields as crawl_url_content
+        (success, content in Markdown, summary, or an error).
+    """,
+    args_schema=CrawlUrlsArgs,
+)
+
+async def crawl_and_process(urls: List[str], query: str = None, max_length: int = 1000) -> List[dict]:
+    """
+    Crawl several URLs concurrently and process each page's content.
+
+    Args:
+        urls: The URLs to crawl
+        query: Optional query to focus the extraction
+        max_length: Maximum length of processed content per URL
+
+    Returns:
+        List of dicts, one per URL in input order, containing the URL,
+        the crawl summary and the processed content
+    """
+    results = []
+    for url, crawled in zip(urls, await crawl_many(urls)):
+        if not crawled["success"]:
+            results.append({"url": url, "success": False, "error": crawled["error"]})
+            continue
+        processed = _process_long_content(crawled["content"], query, max_length)
+        results.append({
+            "url": url,
+            "success": processed["success"],
+            "summary": crawled["summary"],
+            **{k: v for k, v in processed.items() if k != "success"}
+        })
+    return results
+
+async def crawl_and_process_urls_async(urls: List[str], query: str = None, max_length: int = 1000) -> str:
+    """Crawl and process several URLs concurrently, returned as a JSON string."""
+    try:
+        results = await crawl_and_process(urls, query, max_length)
+        return _dumps({
+            "success": True,
+            "results": results,
+            "total_results": len(results)
+        })
+    except Exception as e:
+        logger.error(f"Error in crawl_and_process_urls: {str(e)}")
+        return _error(str(e), results=[])
+
+def crawl_and_process_urls(urls: List[str], query: str = None, max_length: int = 1000) -> str:
+    """Synchronous wrapper for crawl_and_process_urls_async."""
+    try:
+        return _run_crawl(crawl_and_process_urls_async(urls, query, max_length))
+    except Exception as e:
+        logger.error(f"Error running async crawl_and_process_urls: {str(e)}")
+        return _error(f"Asyncio execution error: {str(e)}", results=[])
+
+crawl_and_process_tool = StructuredTool.from_function(
+    func=crawl_and_process_urls,
+    coroutine=crawl_and_process_urls_async,
+    name="crawl_and_process_urls",
+    description="""
+    Crawl several web pages at once and extract the relevant parts of each.
+    Use this instead of calling crawl_url_content and process_long_content
+    one URL at a time when you need content from multiple links.
+
+    Args:
+        urls: List of direct URL strings to crawl
+        query: Optional query to focus the extraction
+        max_length: Maximum length of processed content per URL
+
+    Returns:
+        For each URL: a summary and the processed content, in input order.
+    """,
+    args_schema=CrawlAndProcessArgs,
+)
+
+@dataclass(slots=True)
+class FeedInfo:
+    id: int
+    name: str
+    url: str
+
+@dataclass(slots=True)
+class FeedsResponse:
+    success: bool
+    feeds: List[FeedInfo]
+    total_feeds: int
+
+# Feeds can be added or renamed by other processes (add-feeds, import-opml, fetch-all),
+# so cached lookups expire after a short time
+FIND_FEEDS_CACHE_TTL = 60.0
+FIND_FEEDS_CACHE_SIZE = 256
+
+# Normalized query -> (time cached, JSON response), oldest first
+_find_feeds_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_find_feeds_cache_lock = threading.Lock()
+
+def _find_feeds_cached(query: str) -> str:
+    """Run the feed name lookup for a normalized query; errors propagate so they are not cached"""
+    now = time.monotonic()
+    with _find_feeds_cache_lock:
+        cached = _find_feeds_cache.get(query)
+    if cached is not None and now - cached[0] < FIND_FEEDS_CACHE_TTL:
+        return cached[1]
+    
+    with get_read_session() as db:
+        # Use LIKE for partial name matching (case-insensitive), selecting only the columns we return
+        rows = db.query(DBFeed.id, DBFeed.name, DBFeed.url).filter(DBFeed.name.ilike(f"%{query}%")).all()
+        
+        # orjson serializes the slotted dataclasses directly, without intermediate dicts
+        feeds_info = [FeedInfo(feed_id, name, url) for feed_id, name, url in rows]
+        response = _dumps(FeedsResponse(True, feeds_info, len(feeds_info)))
+    
+    with _find_feeds_cache_lock:
+        if feeds_info:
+            _find_feeds_cache[query] = (now, response)
+            _find_feeds_cache.move_to_end(query)
+            if len(_find_feeds_cache) > FIND_FEEDS_CACHE_SIZE:
+                _find_feeds_cache.popitem(last=False)
+        else:
+            # Don't cache misses: the feed may be added at any moment
+            _find_feeds_cache.pop(query, None)
+    return response
+
+def invalidate_find_feeds_cache() -> None:
+    """Drop cached find_feeds results, e.g. after feeds were fetched or renamed"""
+    with _find_feeds_cache_lock:
+        _find_feeds_cache.clear()
+
 def find_feeds(query: str) -> str:
     """
     Find feeds by partial name match in database
     
+    Non-empty results are cached per normalized query for FIND_FEEDS_CACHE_TTL
+    seconds; call invalidate_find_feeds_cache() after feeds change.
+    
     Args:
         query: Search term to find in feed names (case-insensitive partial match)
         
@@ -878,41 +1242,11 @@ def find_feeds(query: str) -> str:
         - feeds: list of matching feeds with their details
         - total_feeds: number of feeds found
     """
-    with get_db_session() as db:
-        try:
-            # Use LIKE for partial name matching (case-insensitive)
-            feeds = db.query(DBFeed).filter(DBFeed.name.ilike(f"%{query}%")).all()
-            
-            if not feeds:
-                return json.dumps({
-                    "success": True,
-                    "feeds": [],
-                    "total_feeds": 0
-                })
-            
-            # Format feed information
-            feeds_info = []
-            for feed in feeds:
-                feeds_info.append({
-                    "id": feed.id,
-                    "name": feed.name,
-                    "url": feed.url
-                })
-            
-            return json.dumps({
-                "success": True,
-                "feeds": feeds_info,
-                "total_feeds": len(feeds_info)
-            })
-            
-        except Exception as e:
-            logger.error(f"Error in find_feeds: {str(e)}")
-            return json.dumps({
-                "success": False,
-                "error": str(e),
-                "feeds": [],
-                "total_feeds": 0
-            })
+    try:
+        return _find_feeds_cached(query.strip().lower())
+    except Exception as e:
+        logger.error(f"Error in find_feeds: {str(e)}")
+        return _error(str(e), feeds=[], total_feeds=0)
 
 # Create the find_feeds tool
 find_feeds_tool = Tool(
@@ -933,12 +1267,15 @@ find_feeds_tool = Tool(
 # Update the tools list
 tools = [
     get_feed_details_tool,
+    get_feed_stats_tool,
     get_category_feeds_tool,
     fetch_feed_tool,
     search_related_feeds_tool,
     find_feeds_tool,  
     crawl_url_tool,
-    process_content_tool
+    crawl_urls_tool,
+    process_content_tool,
+    crawl_and_process_tool
 ]
 
 # MCP tools
@@ -954,9 +1291,9 @@ def list_feeds() -> str:
     # Reuse get_all_categories and get_category_feeds_info
     try:
         # Get all categories first
-        categories_data = json.loads(get_all_categories())
+        categories_data = _get_all_categories()
         if not categories_data["success"]:
-            return json.dumps(categories_data)
+            return _dumps(categories_data)
             
         # Get feeds for each category
         result = {
@@ -968,7 +1305,7 @@ def list_feeds() -> str:
         for cat_info in categories_data["categories"]:
             category_name = cat_info["name"]
             # Get detailed feed info for this category
-            feeds_data = json.loads(get_category_feeds_info(category_name))
+            feeds_data = _get_category_feeds_info(category_name)
             if feeds_data["success"]:
                 result["categories"].append({
                     "name": category_name,
@@ -986,14 +1323,10 @@ def list_feeds() -> str:
         
         result["total_categories"] = len(result["categories"])
         result["total_feeds"] = total_feeds
-        return json.dumps(result)
+        return _dumps(result)
         
     except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": str(e),
-            "categories": []
-        })
+        return _error(str(e), categories=[])
 
 def search_feeds(query: str) -> str:
     """
@@ -1007,18 +1340,18 @@ def search_feeds(query: str) -> str:
     """
     # Reuse search_related_feeds
     try:
-        search_results = json.loads(search_related_feeds(query))
+        search_results = _search_related_feeds(query)
         if not search_results["success"]:
-            return json.dumps(search_results)
+            return _dumps(search_results)
             
         # Convert to MCP format
-        return json.dumps({
+        return _dumps({
             "success": True,
             "results": [
                 {
                     "name": feed["name"],
                     "url": feed["url"],
-                    "title": feed["title"],
+                    "title": feed["name"],
                     "description": feed.get("description", ""),
                     "relevance_score": feed.get("relevance_score", 0)
                 }
@@ -1028,11 +1361,7 @@ def search_feeds(query: str) -> str:
         })
         
     except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": str(e),
-            "results": []
-        })
+        return _error(str(e), results=[])
 
 def get_feed_summary(feed_id: int) -> str:
     """
@@ -1044,24 +1373,20 @@ def get_feed_summary(feed_id: int) -> str:
     Returns:
         JSON string containing feed summary and latest entries
     """
-    with get_db_session() as db:
+    with get_read_session() as db:
         try:
             # Get feed from database
             db_feed = db.query(DBFeed).filter(DBFeed.id == feed_id).first()
             if not db_feed:
-                return json.dumps({
-                    "success": False,
-                    "error": f"Feed with ID {feed_id} not found",
-                    "feed": None
-                })
+                return _error(f"Feed with ID {feed_id} not found", feed=None)
             
             # Reuse get_feed_details logic
-            feed_details = json.loads(get_feed_details(db_feed.name))
+            feed_details = _get_feed_details(db_feed.name)
             if not feed_details["success"]:
-                return json.dumps(feed_details)
+                return _dumps(feed_details)
             
             # Convert to MCP format
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "feed": {
                     "id": feed_id,
@@ -1074,12 +1399,7 @@ def get_feed_summary(feed_id: int) -> str:
             })
             
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e),
-                "feed": None,
-                "latest_entries": []
-            })
+            return _error(str(e), feed=None, latest_entries=[])
 
 # Define MCP tools
 list_feeds_tool = Tool(
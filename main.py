@@ -1,69 +1,24 @@
 import argparse
-from database.db import init_db, drop_db, SessionLocal
-from llm.chat import RSSChat
+import sys
 from config import config
-from cli import (
-    display_categories,
-    display_feeds,
-    update_feeds_from_json,
-    add_feeds,
-    fetch_category_feeds,
-    import_opml,
-    fetch_single_feed,
-    fetch_all_feeds
-)
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from contextlib import contextmanager
-from database.models import Feed
-import uvicorn
-from api.rss_cli_mcp import app as mcp_app
 
 # Initialize rich console
 console = Console()
 
-@contextmanager
-def get_db_session():
-    """Create a new database session."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def _cli():
+    """Import the cli package on first use, so help and usage errors don't load the database stack"""
+    import cli
+    return cli
 
-def format_feed_info(feed, entries=None):
-    """Format feed information for display"""
-    # Handle both Feed and DBFeed objects
-    if isinstance(feed, Feed):
-        title = feed.name or "Untitled Feed"
-        url = feed.url
-        last_updated = None
-    else:
-        title = feed.title or feed.name or "Untitled Feed"
-        url = feed.url
-        last_updated = feed.last_updated
-    
-    info = [
-        f"[bold cyan]Feed:[/bold cyan] {title}",
-        f"[bold blue]URL:[/bold blue] {url}",
-        f"[bold green]Last Updated:[/bold green] {last_updated.strftime('%Y-%m-%d %H:%M:%S') if last_updated else 'Never'}"
-    ]
-    
-    if entries:
-        info.append(f"\n[bold yellow]Latest entries[/bold yellow] ({len(entries)}):")
-        for entry in entries:
-            info.append(f"[bold]- {entry.title}[/bold]")
-            info.append(f"  [dim]Published: {entry.published_date.strftime('%Y-%m-%d %H:%M:%S') if entry.published_date else 'Unknown'}[/dim]")
-            info.append(f"  [blue link={entry.link}]Link[/blue]\n")
-    
-    return "\n".join(info)
+# Argument-less display commands; they are dispatched before the full parser is built
+FAST_COMMANDS = {
+    'list-categories': lambda: _cli().display_categories(),
+    'list-feeds': lambda: _cli().display_feeds(),
+}
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='RSS CLI with AI-powered feed management and interaction',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Usage examples shown at the end of the help output
+EPILOG = """
 Examples:
   # List all available feed categories
   python main.py list-categories
@@ -86,6 +41,9 @@ Examples:
   # Fetch latest content for all feeds
   python main.py fetch-all
   
+  # Fetch all feeds with 20 concurrent workers
+  python main.py fetch-all -workers 20
+  
   # Update feeds configuration from feeds.json
   python main.py update-feedjs
   
@@ -100,77 +58,245 @@ Examples:
 
   # Start MCP server
   python main.py mcp
-        """
-    )
-    
-    # Global options that can be used with any command
-    parser.add_argument('-debug', action='store_true', help='Enable debug mode for verbose output')
-    subparsers = parser.add_subparsers(dest='command', help='Available commands', required=False)
-    
-    # Common arguments for fetch commands
-    fetch_parent_parser = argparse.ArgumentParser(add_help=False)
-    fetch_parent_parser.add_argument('-items', type=int, help='Maximum number of items to fetch per feed')
-    fetch_parent_parser.add_argument('-hours', type=int, help='Maximum age of entries in hours')
-    
-    # Help command
-    subparsers.add_parser('help', help='Show this help message')
-    
-    # Database management
-    subparsers.add_parser('reset-db', help='Reset the database and recreate all tables')
+"""
+
+# Welcome banner for the chat interface; kept as source so the markdown parser is
+# only imported and run by the chat command
+WELCOME_MD = """# RSS CLI AI Chat Interface
+
+You can:
+1. 🔍 Search feeds by category
+   - Example: "show me tech feeds"
+2. 📰 Get feed details
+   - Example: "what's new on Hacker News?"
+3. 🎯 Search by topic
+   - Example: "find feeds about machine learning"
+4. 🔄 Update feeds
+   - Example: "update OpenAI Blog"
+
+💡 Tip: Use `-help` to see all available command line options
+
+Type 'quit' to exit."""
+
+def run_mcp(args):
+    """Start the MCP server"""
+    from rich.panel import Panel
     
-    # Feed management
-    add_feeds_parser = subparsers.add_parser('add-feeds', help='Interactively add new RSS feeds')
-    add_feeds_parser.add_argument('-category', type=str, help='Specify a category when adding feeds')
+    console.print("[bold green]Starting MCP server...[/bold green]")
+    console.print(Panel("""[bold cyan]Configure MCP in Cursor settings:[/bold cyan]
+
+[white]Add the following to your Cursor settings:[/white]
+
+{
+  "rss_mcp": {
+    "url": "http://127.0.0.1:8000/mcp"
+  }
+}
+
+[dim]The server is now running at http://127.0.0.1:8000[/dim]""", border_style="green"))
+    import uvicorn
+    from api.rss_cli_mcp import app as mcp_app
+    uvicorn.run(mcp_app, 
+               host=getattr(args, 'host', "127.0.0.1"),
+               port=getattr(args, 'port', 8000), 
+               # "auto" picks uvloop and httptools when they are installed
+               # (uvicorn[standard]) and falls back to asyncio and h11 otherwise
+               loop="auto",
+               http="auto",
+               access_log=False)
+
+def run_chat(args):
+    """Start the interactive AI chat interface"""
+    import threading
+    from concurrent.futures import Future
     
-    subparsers.add_parser('fetch-all', help='Fetch latest content for all feeds', parents=[fetch_parent_parser])
+    chat_future = Future()
     
-    fetch_category = subparsers.add_parser('fetch-category', help='Fetch latest content for all feeds in a specific category', parents=[fetch_parent_parser])
-    fetch_category.add_argument('category', type=str, help='Category name')
+    def create_chat():
+        # The LLM stack is only imported for the chat command
+        try:
+            from llm.chat import RSSChat
+            chat = RSSChat(config=config, debug=args.debug)
+            chat.warm_up()
+        except BaseException as e:
+            chat_future.set_exception(e)
+        else:
+            chat_future.set_result(chat)
     
-    fetch_feed = subparsers.add_parser('fetch-feed', help='Fetch latest content for a single feed by name', parents=[fetch_parent_parser])
-    fetch_feed.add_argument('name', type=str, help='Feed name')
+    # Import and build the chat agent in the background while the welcome
+    # banner is shown and the user types their first question. A daemon thread,
+    # so quitting early doesn't wait for the model preload to finish
+    threading.Thread(target=create_chat, name="chat-startup", daemon=True).start()
+    chat = None
     
-    import_opml_parser = subparsers.add_parser('import-opml', help='Import feeds from OPML file')
-    import_opml_parser.add_argument('file', type=str, help='OPML file path')
+    def start_chat():
+        """Wait for the background agent; report why it failed instead of retrying the same error"""
+        try:
+            return chat_future.result()
+        except Exception as e:
+            console.print(f"\n[red]Could not start the chat agent: {str(e)}[/red]")
+            return None
     
-    subparsers.add_parser('update-feedjs', help='Update feeds configuration from feeds.json')
+    if console.is_terminal:
+        from rich.markdown import Markdown
+        from rich.panel import Panel
+        console.print(Panel(Markdown(WELCOME_MD), border_style="green"))
+    else:
+        # Piped output gets the banner source as-is, without parsing the markdown
+        console.print(WELCOME_MD, markup=False, highlight=False)
     
+    while True:
+        # Stop before prompting if the agent has already failed to start
+        if chat is None and chat_future.done():
+            chat = start_chat()
+            if chat is None:
+                sys.exit(1)
+        
+        query = console.input("\n[bold yellow]🤠 You:[/bold yellow] ")
+        if query.lower() == 'quit':
+            break
+            
+        try:
+            console.print("\n[bold green]🤖 Agent:[/bold green]\n")
+            
+            if chat is None:
+                chat = start_chat()
+                if chat is None:
+                    sys.exit(1)
+            
+            # Stream the response. Model tokens are written raw by the chat's callback
+            # handler; the chunks yielded here are the few status lines that carry markup
+            print_chunk = console.print
+            for chunk in chat.chat_stream(query):
+                print_chunk(chunk, end="")
+            console.print()  # Add newline after response
+            
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Chat interrupted by user[/yellow]")
+            break
+        except Exception as e:
+            if args.debug:
+                console.print(f"\n[red]Error: {str(e)}[/red]")
+            else:
+                console.print("\n[red]An error occurred. Please try again.[/red]")
+
+# Handlers for commands that run after the database is initialized
+COMMANDS = {
+    'add-feeds': lambda args: _cli().add_feeds(args.category, args.debug),
+    'fetch-category': lambda args: _cli().fetch_category_feeds(args.category, args.debug),
+    'fetch-feed': lambda args: _cli().fetch_single_feed(args.name, args.debug),
+    'fetch-all': lambda args: _cli().fetch_all_feeds(args.debug),
+    'update-feedjs': lambda args: _cli().update_feeds_from_json(args.debug),
+    'import-opml': lambda args: _cli().import_opml(args.file, args.debug),
+    'mcp': run_mcp,
+    'chat': run_chat,
+}
+
+def _fetch_options() -> argparse.ArgumentParser:
+    """Common arguments for fetch commands"""
+    fetch_parent_parser = argparse.ArgumentParser(add_help=False)
+    fetch_parent_parser.add_argument('-items', type=int, help='Maximum number of items to fetch per feed')
+    fetch_parent_parser.add_argument('-hours', type=int, help='Maximum age of entries in hours')
+    fetch_parent_parser.add_argument('-workers', type=int, help='Number of feeds to fetch concurrently')
+    return fetch_parent_parser
+
+def _add_simple(help_text):
+    """Builder for a subcommand without arguments of its own"""
+    def build(subparsers, name):
+        subparsers.add_parser(name, help=help_text)
+    return build
+
+def _add_fetch_command(help_text, argument=None, argument_help=None):
+    """Builder for a subcommand that takes the common fetch options"""
+    def build(subparsers, name):
+        fetch_parser = subparsers.add_parser(name, help=help_text, parents=[_fetch_options()])
+        if argument:
+            fetch_parser.add_argument(argument, type=str, help=argument_help)
+    return build
+
+def _add_add_feeds(subparsers, name):
+    add_feeds_parser = subparsers.add_parser(name, help='Interactively add new RSS feeds')
+    add_feeds_parser.add_argument('-category', type=str, help='Specify a category when adding feeds')
+
+def _add_mcp(subparsers, name):
+    mcp = subparsers.add_parser(name, help='Start the MCP server')
+    mcp.add_argument('-port', type=int, default=8000, help='Port for MCP server (default: 8000)')
+    mcp.add_argument('-host', type=str, default="127.0.0.1", help='Host for MCP server (default: 127.0.0.1)')
+
+# Subparser builders, in the order they are listed in the help output
+SUBCOMMANDS = {
+    'help': _add_simple('Show this help message'),
+    # Database management
+    'reset-db': _add_simple('Reset the database and recreate all tables'),
+    # Feed management
+    'add-feeds': _add_add_feeds,
+    'fetch-all': _add_fetch_command('Fetch latest content for all feeds'),
+    'fetch-category': _add_fetch_command('Fetch latest content for all feeds in a specific category', 'category', 'Category name'),
+    'fetch-feed': _add_fetch_command('Fetch latest content for a single feed by name', 'name', 'Feed name'),
+    'import-opml': _add_fetch_command('Import feeds from OPML file', 'file', 'OPML file path'),
+    'update-feedjs': _add_simple('Update feeds configuration from feeds.json'),
     # Information display
-    subparsers.add_parser('list-categories', help='List all available feed categories')
-    subparsers.add_parser('list-feeds', help='List all configured feeds')
-    
+    'list-categories': _add_simple('List all available feed categories'),
+    'list-feeds': _add_simple('List all configured feeds'),
     # Chat interface
-    subparsers.add_parser('chat', help='Start the AI chat interface')
-    
+    'chat': _add_simple('Start the AI chat interface'),
     # MCP server
-    mcp = subparsers.add_parser('mcp', help='Start the MCP server')
-    mcp.add_argument('-port', type=int, default=8000, help='Port for MCP server (default: 8000)')
-    mcp.add_argument('-host', type=str, default="127.0.0.1", help='Host for MCP server (default: 127.0.0.1)')
+    'mcp': _add_mcp,
+}
+
+def _sniff_command(argv):
+    """Return the first positional token, which is the subcommand if one was given"""
+    return next((arg for arg in argv if not arg.startswith('-')), None)
+
+def main():
+    if len(sys.argv) == 2 and sys.argv[1] in FAST_COMMANDS:
+        FAST_COMMANDS[sys.argv[1]]()
+        return
+
+    parser = argparse.ArgumentParser(
+        description='RSS CLI with AI-powered feed management and interaction',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
+    )
+    
+    # Global options that can be used with any command
+    parser.add_argument('-debug', action='store_true', help='Enable debug mode for verbose output')
+    subparsers = parser.add_subparsers(dest='command', help='Available commands', required=False)
+    # If no command is provided, default to chat mode
+    parser.set_defaults(command='chat')
+    
+    # Only the invoked subcommand's parser is built; help and unknown commands get all of them
+    command = _sniff_command(sys.argv[1:])
+    names = [command] if command in SUBCOMMANDS and command != 'help' else SUBCOMMANDS
+    for name in names:
+        SUBCOMMANDS[name](subparsers, name)
 
     args = parser.parse_args()
     
     # Override config values if custom limits are provided
-    if hasattr(args, 'items') and args.items is not None:
-        config.rss.max_entries_per_feed = args.items
-    if hasattr(args, 'hours') and args.hours is not None:
-        config.rss.max_age_hours = args.hours
-    
-    # If no command is provided, default to chat mode
-    if not args.command:
-        args.command = 'chat'
+    items = getattr(args, 'items', None)
+    if items is not None:
+        config.rss.max_entries_per_feed = items
+    hours = getattr(args, 'hours', None)
+    if hours is not None:
+        config.rss.max_age_hours = hours
+    if items is not None or hours is not None:
+        # Custom limits can select entries the last fetch left out, so always download in full
+        config.rss.conditional_fetch = False
+    workers = getattr(args, 'workers', None)
+    if workers is not None:
+        config.rss.fetch_workers = workers
     
     # Handle help command
     if args.command == 'help':
         parser.print_help()
         return
         
-    if args.command == 'list-categories':
-        display_categories()
+    if args.command in FAST_COMMANDS:
+        FAST_COMMANDS[args.command]()
         return
     
-    if args.command == 'list-feeds':
-        display_feeds()
-        return
+    from database.db import init_db, drop_db
     
     if args.command == 'reset-db':
         with console.status("[bold yellow]Resetting database...[/bold yellow]"):
@@ -181,87 +307,9 @@ Examples:
         # Just ensure tables exist
         init_db()
     
-    if args.command == 'add-feeds':
-        add_feeds(args.category if hasattr(args, 'category') else None, args.debug)
-    
-    if args.command == 'fetch-category':
-        fetch_category_feeds(args.category, args.debug)
-    
-    if args.command == 'fetch-feed':
-        fetch_single_feed(args.name, args.debug)
-    
-    if args.command == 'fetch-all':
-        fetch_all_feeds(args.debug)
-    
-    if args.command == 'update-feedjs':
-        update_feeds_from_json(args.debug)
-    
-    if args.command == 'import-opml':
-        import_opml(args.file, args.debug)
-    
-    if args.command == 'mcp':
-        console.print("[bold green]Starting MCP server...[/bold green]")
-        console.print(Panel("""[bold cyan]Configure MCP in Cursor settings:[/bold cyan]
-
-[white]Add the following to your Cursor settings:[/white]
-
-{
-  "rss_mcp": {
-    "url": "http://127.0.0.1:8000/mcp"
-  }
-}
-
-[dim]The server is now running at http://127.0.0.1:8000[/dim]""", border_style="green"))
-        uvicorn.run(mcp_app, 
-                   host=args.host if hasattr(args, 'host') else "127.0.0.1",
-                   port=args.port if hasattr(args, 'port') else 8000, 
-                   loop="asyncio")
-        return
-
-    # Start chat interface if requested or if no other action was specified
-    if args.command == 'chat':
-        # Create chat instance
-        chat = RSSChat(config=config, debug=args.debug)
-        
-        welcome_md = """# RSS CLI AI Chat Interface
-
-You can:
-1. 🔍 Search feeds by category
-   - Example: "show me tech feeds"
-2. 📰 Get feed details
-   - Example: "what's new on Hacker News?"
-3. 🎯 Search by topic
-   - Example: "find feeds about machine learning"
-4. 🔄 Update feeds
-   - Example: "update OpenAI Blog"
-
-💡 Tip: Use `-help` to see all available command line options
-
-Type 'quit' to exit."""
-        
-        console.print(Panel(Markdown(welcome_md), border_style="green"))
-        
-        while True:
-            query = console.input("\n[bold yellow]🤠 You:[/bold yellow] ")
-            if query.lower() == 'quit':
-                break
-                
-            try:
-                console.print("\n[bold green]🤖 Agent:[/bold green]\n")
-                
-                # Stream the response
-                for chunk in chat.chat_stream(query):
-                    console.print(chunk, end="")
-                console.print()  # Add newline after response
-                
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Chat interrupted by user[/yellow]")
-                break
-            except Exception as e:
-                if args.debug:
-                    console.print(f"\n[red]Error: {str(e)}[/red]")
-                else:
-                    console.print("\n[red]An error occurred. Please try again.[/red]")
+    handler = COMMANDS.get(args.command)
+    if handler is not None:
+        handler(args)
 
 if __name__ == '__main__':
     try:
@@ -1,11 +1,20 @@
-from .feeds import get_all_feeds, get_feeds_by_category, get_available_categories, get_feed_by_name, FEED_CATEGORIES, _load_feeds
-from .rss_fetcher import RSSFetcher
+from .feeds import get_all_feeds, get_feeds_by_category, get_available_categories, get_feed_by_name, find_category, get_category_by_url, FEED_CATEGORIES, _load_feeds
+
+def __getattr__(name):
+    # RSSFetcher pulls in feedparser, the embeddings client and the database layer,
+    # so it is only imported when first used
+    if name == 'RSSFetcher':
+        from .rss_fetcher import RSSFetcher
+        return RSSFetcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'get_all_feeds',
     'get_feeds_by_category',
     'get_available_categories',
     'get_feed_by_name',
+    'find_category',
+    'get_category_by_url',
     'RSSFetcher',
     'FEED_CATEGORIES',
     '_load_feeds'
@@ -1,10 +1,12 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from dataclasses import dataclass
-import json
+from functools import cache
+import hashlib
 import os
+import orjson
 from config import config
 
-@dataclass
+@dataclass(slots=True)
 class Feed:
     url: str
     name: str
@@ -15,35 +17,83 @@ class Feed:
 # Global feed categories that will be loaded from file
 FEED_CATEGORIES: Dict[str, List[Feed]] = {}
 
+# Lookup indexes over FEED_CATEGORIES, rebuilt whenever feeds are loaded or updated
+_FEEDS_BY_NAME: Dict[str, Feed] = {}
+_CATEGORIES_CI: Dict[str, str] = {}
+_CATEGORY_BY_URL: Dict[str, str] = {}
+_ALL_FEEDS: List[Feed] = []
+
+def _rebuild_indexes():
+    """Rebuild the name and category lookup indexes from FEED_CATEGORIES"""
+    global _FEEDS_BY_NAME, _CATEGORIES_CI, _CATEGORY_BY_URL, _ALL_FEEDS
+    feeds_by_name = {}
+    category_by_url = {}
+    all_feeds = []
+    for category, feeds in FEED_CATEGORIES.items():
+        all_feeds.extend(feeds)
+        for feed in feeds:
+            # Keep the first match, matching the order of get_all_feeds
+            feeds_by_name.setdefault(feed.name, feed)
+            category_by_url.setdefault(feed.url, category)
+    _FEEDS_BY_NAME = feeds_by_name
+    _CATEGORY_BY_URL = category_by_url
+    _ALL_FEEDS = all_feeds
+    _CATEGORIES_CI = {}
+    for category in FEED_CATEGORIES:
+        _CATEGORIES_CI.setdefault(category.lower(), category)
+
+@cache
+def _console():
+    """Console for feeds file warnings, created on first use"""
+    from rich.console import Console
+    return Console()
+
+# (path, mtime_ns, size) of the feeds file FEED_CATEGORIES was last loaded from
+_FEEDS_SOURCE: Optional[tuple] = None
+
+def _read_feeds_file(path: str) -> Dict[str, List[Feed]]:
+    """Parse a feeds file into a category -> feeds mapping"""
+    with open(path, 'rb') as f:
+        data = orjson.loads(f.read())
+    return {
+        category: [
+            Feed(
+                feed['url'],
+                feed['name'],
+                feed.get('description', ''),
+                feed.get('update_interval', 3600),
+                feed.get('category', ''),
+            )
+            for feed in feeds
+        ]
+        for category, feeds in data.items()
+    }
+
 def _load_feeds():
-    """Load feeds from file"""
-    global FEED_CATEGORIES
+    """Load feeds from file, skipping the parse if the file is unchanged since the last load"""
+    global FEED_CATEGORIES, _FEEDS_SOURCE
+    # Try the configured path first, then the package directory
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    package_feeds = os.path.join(package_dir, 'feeds.json')
+    path = next((p for p in (config.rss.feeds_file, package_feeds) if os.path.exists(p)), None)
+    if path is not None:
+        try:
+            # Nanosecond mtime plus size, so a rewrite within the same timestamp tick is still noticed
+            stat = os.stat(path)
+            source = (path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            source = None
+        if source is not None and source == _FEEDS_SOURCE:
+            return
+    _FEEDS_SOURCE = None
     try:
-        # Try loading from the configured path first
-        if os.path.exists(config.rss.feeds_file):
-            with open(config.rss.feeds_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                FEED_CATEGORIES = {
-                    category: [Feed(**feed) for feed in feeds]
-                    for category, feeds in data.items()
-                }
-                return
-        
-        # If not found, try looking in the package directory
-        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        package_feeds = os.path.join(package_dir, 'feeds.json')
-        if os.path.exists(package_feeds):
-            with open(package_feeds, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                FEED_CATEGORIES = {
-                    category: [Feed(**feed) for feed in feeds]
-                    for category, feeds in data.items()
-                }
-                return
+        if path is not None:
+            FEED_CATEGORIES = _read_feeds_file(path)
+            _FEEDS_SOURCE = source
+            return
         
         # If still not found, show error message
-        from rich.console import Console
-        console = Console()
+        console = _console()
         console.print("[yellow]No feeds file found![/yellow]")
         console.print(f"[yellow]Expected locations:[/yellow]")
         console.print(f"  - {config.rss.feeds_file}")
@@ -52,43 +102,56 @@ def _load_feeds():
         console.print("  rss add-feed")
         FEED_CATEGORIES = {}
     except Exception as e:
-        from rich.console import Console
-        console = Console()
+        console = _console()
         console.print(f"[red]Error loading feeds file: {str(e)}[/red]")
         console.print("[green]You can add feeds using:[/green]")
         console.print("  rss add-feed")
-        FEED_CATEGORIES = {}
+        # Keep whatever was loaded before; FEED_CATEGORIES is only replaced after a successful parse
+    finally:
+        _rebuild_indexes()
+
+# (digest, mtime_ns, size) of the feeds file as _save_feeds last wrote it
+_SAVED_STATE: Optional[tuple] = None
 
 def _save_feeds():
     """Save feeds to file"""
+    global _SAVED_STATE
     data = {
         category: [{"url": feed.url, "name": feed.name} for feed in feeds]
         for category, feeds in FEED_CATEGORIES.items()
     }
-    with open(config.rss.feeds_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Byte-for-byte the same output as json.dump(indent=2, ensure_ascii=False)
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    path = config.rss.feeds_file
+    
+    # Skip the write if this exact content is what we last wrote and the file is untouched since
+    try:
+        stat = os.stat(path)
+        if (digest, stat.st_mtime_ns, stat.st_size) == _SAVED_STATE:
+            return
+    except OSError:
+        pass
+    
+    # Write a temporary file and rename it over the original, so a crash mid-write
+    # can't leave a truncated feeds file behind
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    stat = os.stat(path)
+    _SAVED_STATE = (digest, stat.st_mtime_ns, stat.st_size)
 
 def update_feed_categories(new_categories: Dict[str, List[Feed]]) -> None:
     """Update FEED_CATEGORIES with new categories and feeds"""
     global FEED_CATEGORIES
     
-    # Load existing feeds if not loaded
-    if not FEED_CATEGORIES:
-        _load_feeds()
-    
-    # Create a set of existing URLs for quick lookup
-    existing_urls = {
-        feed.url
-        for feeds in FEED_CATEGORIES.values()
-        for feed in feeds
-    }
+    # Pick up any edits made to the feeds file before merging and saving over it
+    _load_feeds()
     
-    # Create a map of existing names to avoid duplicates
-    existing_names = {
-        feed.name: feed
-        for feeds in FEED_CATEGORIES.values()
-        for feed in feeds
-    }
+    # Track existing URLs and names in copies of the lookup indexes rather than rescanning every feed
+    existing_urls = set(_CATEGORY_BY_URL)
+    existing_names = dict(_FEEDS_BY_NAME)
     
     # Merge new categories with existing ones
     for category, feeds in new_categories.items():
@@ -112,41 +175,41 @@ def update_feed_categories(new_categories: Dict[str, List[Feed]]) -> None:
             existing_urls.add(feed.url)
             existing_names[feed.name] = feed
     
+    _rebuild_indexes()
+    
     # Save the updated feeds to file
     _save_feeds()
 
 def get_all_feeds() -> List[Feed]:
     """Get all feeds from all categories"""
-    if not FEED_CATEGORIES:
-        _load_feeds()
-    all_feeds = []
-    for feeds in FEED_CATEGORIES.values():
-        all_feeds.extend(feeds)
-    return all_feeds
+    # Copy so callers can't modify the cached list
+    return list(_ALL_FEEDS)
 
 def get_feeds_by_category(category: str) -> List[Feed]:
     """Get feeds by category"""
-    if not FEED_CATEGORIES:
-        _load_feeds()
-    # Try exact match first, then case-insensitive match
-    return FEED_CATEGORIES.get(category) or FEED_CATEGORIES.get(category.upper()) or FEED_CATEGORIES.get(category.lower(), [])
+    # Try exact match first, then a case-insensitive match through the category index
+    feeds = FEED_CATEGORIES.get(category)
+    if feeds is None:
+        feeds = FEED_CATEGORIES.get(_CATEGORIES_CI.get(category.lower()), [])
+    return feeds
 
 def get_available_categories() -> List[str]:
     """Get list of available feed categories"""
-    if not FEED_CATEGORIES:
-        _load_feeds()
     return list(FEED_CATEGORIES.keys())
 
+def find_category(category: str) -> Optional[str]:
+    """Get the configured category name matching `category` case-insensitively"""
+    return _CATEGORIES_CI.get(category.lower())
+
+def get_category_by_url(url: str) -> Optional[str]:
+    """Get the category a feed URL is configured under"""
+    return _CATEGORY_BY_URL.get(url)
+
 def get_feed_by_name(name: str) -> Feed:
     """Get feed by name"""
-    if not FEED_CATEGORIES:
-        _load_feeds()
     # Strip any quotes from the name
     name = name.strip().strip('"\'')
-    for feed in get_all_feeds():
-        if feed.name == name:
-            return feed
-    return None
+    return _FEEDS_BY_NAME.get(name)
 
-# Load feeds when module is imported
+# Load feeds when module is imported; the getters above read the indexes directly
 _load_feeds() 
\ No newline at end of file
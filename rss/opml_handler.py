@@ -1,56 +1,58 @@
 import xml.etree.ElementTree as ET
-from typing import Dict, List
+from itertools import count
+from typing import Dict, List, Optional
 from .feeds import Feed
 
 def parse_opml(opml_path: str) -> Dict[str, List[Feed]]:
     """
     Parse OPML file into Dict[str, List[Feed]] structure
     """
-    tree = ET.parse(opml_path)
-    root = tree.getroot()
-    body = root.find('body')
-    
     result: Dict[str, List[Feed]] = {}
     
-    def process_outline(outline: ET.Element, current_category: str = None):
-        if outline.get('xmlUrl'):  # This is a feed
+    # One item per open <outline>: the category name for category outlines, None for feeds.
+    # The file is streamed and each outline is cleared once closed, so the whole tree is never held
+    outlines: List[Optional[str]] = []
+    in_body = False
+    
+    for event, elem in ET.iterparse(opml_path, events=('start', 'end')):
+        if elem.tag == 'body':
+            in_body = event == 'start'
+            continue
+        if elem.tag != 'outline' or not in_body:
+            continue
+        
+        if event == 'end':
+            outlines.pop()
+            elem.clear()
+            continue
+        
+        if outlines and outlines[-1] is None:  # Outlines nested inside a feed are ignored
+            outlines.append(None)
+        elif elem.get('xmlUrl'):  # This is a feed
             feed = Feed(
-                url=outline.get('xmlUrl'),
-                name=outline.get('title') or outline.get('text', '')
+                url=elem.get('xmlUrl'),
+                name=elem.get('title') or elem.get('text', '')
             )
-            
-            category = current_category or 'default'
-            if category not in result:
-                result[category] = []
-            result[category].append(feed)
-            
+            category = (outlines[-1] if outlines else None) or 'default'
+            result.setdefault(category, []).append(feed)
+            outlines.append(None)
         else:  # This is a category
-            category = outline.get('title') or outline.get('text', '')
-            for child in outline:
-                process_outline(child, category)
-    
-    for outline in body:
-        process_outline(outline)
+            outlines.append(elem.get('title') or elem.get('text', ''))
     
     return result
 
 def merge_feeds(opml_feeds: Dict[str, List[Feed]], existing_feeds: Dict[str, List[Feed]]) -> Dict[str, List[Feed]]:
     """Merge new feeds with existing feeds, avoiding duplicates"""
-    merged = existing_feeds.copy()
+    # Copy the lists too so appending never touches the caller's feed lists
+    merged = {category: list(feeds) for category, feeds in existing_feeds.items()}
     
-    # Create a set of existing URLs for quick lookup
-    existing_urls = {
-        feed.url
-        for feeds in existing_feeds.values()
-        for feed in feeds
-    }
-    
-    # Create a map of existing names to avoid duplicates
-    existing_names = {
-        feed.name: feed
-        for feeds in existing_feeds.values()
-        for feed in feeds
-    }
+    # Collect existing URLs (for quick lookup) and names (to avoid duplicates) in one pass
+    existing_urls = set()
+    existing_names = {}
+    for feeds in existing_feeds.values():
+        for feed in feeds:
+            existing_urls.add(feed.url)
+            existing_names[feed.name] = feed
     
     for category, feeds in opml_feeds.items():
         if category not in merged:
@@ -63,10 +65,9 @@ def merge_feeds(opml_feeds: Dict[str, List[Feed]], existing_feeds: Dict[str, Lis
                 
             # If name exists but URL is different, append a number
             base_name = feed.name
-            counter = 1
+            counter = count(1)
             while feed.name in existing_names:
-                feed.name = f"{base_name} ({counter})"
-                counter += 1
+                feed.name = f"{base_name} ({next(counter)})"
             
             merged[category].append(feed)
             # Update our tracking sets/maps
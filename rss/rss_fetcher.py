@@ -1,18 +1,25 @@
 import logging
+import hashlib
 import feedparser
 from typing import List, Optional
+from functools import lru_cache
 from datetime import datetime, timedelta
 from dateutil.parser import parse
 from dateutil.tz import tzlocal, tzutc
 from langchain_ollama import OllamaEmbeddings
 from config import config
 from database.models import Feed as DBFeed, FeedEntry
-from database.db import SessionLocal
-from contextlib import contextmanager
+from database.db import SessionLocal, get_read_session
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import asyncio
 from sqlalchemy.exc import IntegrityError
-from . import FEED_CATEGORIES, _load_feeds
-from sqlalchemy import text
+from sqlalchemy.orm import defer
+from .feeds import get_category_by_url
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 logger = logging.getLogger('rss_ai')
 
@@ -30,14 +37,48 @@ TZINFOS = {
     'UTC': 0,
 }
 
-@contextmanager
-def get_db_session():
-    """Create a new database session."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# Shared embeddings client; query embeddings only depend on the text
+_embeddings = OllamaEmbeddings(
+    base_url=config.ollama.base_url,
+    model=config.ollama.embedding_model
+)
+
+# Shared HTTP session for synchronous fetches, so repeated fetches of the same
+# hosts reuse pooled keep-alive connections instead of a new TLS handshake each time
+_http = requests.Session()
+_http.headers['User-Agent'] = 'rss-cli/1.0'
+_http_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+)
+_http.mount('https://', _http_adapter)
+_http.mount('http://', _http_adapter)
+
+EMBEDDING_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=EMBEDDING_CACHE_SIZE)
+def _embed_query_cached(query: str) -> tuple:
+    """Embed a search query, reusing the result for repeated queries"""
+    return tuple(_embeddings.embed_query(query))
+
+# Date strings repeat across feeds sharing a publishing platform and across re-fetches
+DATE_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date(value: str) -> datetime:
+    """Parse a feed date string feedparser could not handle into a UTC datetime"""
+    # First try to parse with timezone info
+    published_date = parse(value, tzinfos=TZINFOS)
+    # If no timezone info was found, assume UTC
+    if published_date.tzinfo is None:
+        published_date = published_date.replace(tzinfo=tzutc())
+    # Convert to UTC for consistent comparison
+    return published_date.astimezone(tzutc())
+
+def _content_hash(entry_text: str) -> str:
+    """Hash an entry's "title content" text; the same as md5(title || ' ' || content) in PostgreSQL"""
+    return hashlib.md5(entry_text.encode('utf-8'), usedforsecurity=False).hexdigest()
 
 class RSSFetcher:
     def __init__(self, debug: bool = False, max_entries: int = None, max_age_hours: int = None):
@@ -46,10 +87,7 @@ class RSSFetcher:
             logger.setLevel(logging.DEBUG)
         
         # Initialize embeddings model
-        self.embeddings = OllamaEmbeddings(
-            base_url=config.ollama.base_url,
-            model=config.ollama.embedding_model
-        )
+        self.embeddings = _embeddings
         
         # Set custom limits if provided
         self.max_entries = max_entries if max_entries is not None else config.rss.max_entries_per_feed
@@ -64,181 +102,381 @@ class RSSFetcher:
         self.entries_skipped = 0
         
         try:
-            # First try to fetch the raw content with requests
-            response = requests.get(url, timeout=10)
+            # First try to fetch the raw content with the shared session
+            response = _http.get(url, timeout=10, headers=self._conditional_headers(url))
+            if response.status_code == 304:
+                return self._mark_unchanged(url)
             response.raise_for_status()
+            return self._process_feed(
+                url, response.content,
+                response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                response.headers.get('Content-Type')
+            )
+        except Exception as e:
+            logger.error(f"Error fetching feed: {str(e)}")
+            return None
+    
+    async def fetch_feed_async(self, session: aiohttp.ClientSession, url: str) -> Optional[DBFeed]:
+        """
+        Fetch a feed with a shared aiohttp session; parsing and storage run in the loop's executor
+        
+        Args:
+            session: aiohttp session to download with
+            url: Feed URL
+            
+        Returns:
+            The stored DBFeed, or None if the feed could not be fetched
+        """
+        # Reset counters at the start of each fetch
+        self.entries_added = 0
+        self.entries_skipped = 0
+        
+        try:
+            # The validator lookup, feedparser, the embedding calls and the database writes are blocking
+            loop = asyncio.get_running_loop()
+            headers = await loop.run_in_executor(None, self._conditional_headers, url)
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status == 304:
+                    return await loop.run_in_executor(None, self._mark_unchanged, url)
+                response.raise_for_status()
+                body = await response.read()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                content_type = response.headers.get('Content-Type')
+            return await loop.run_in_executor(
+                None, self._process_feed, url, body, etag, last_modified, content_type
+            )
+        except Exception as e:
+            logger.error(f"Error fetching feed: {str(e)}")
+            return None
+    
+    def _conditional_headers(self, url: str) -> dict:
+        """Build If-None-Match / If-Modified-Since headers from the validators stored for a feed"""
+        if not config.rss.conditional_fetch:
+            return {}
+        with get_read_session() as db:
+            row = db.execute(
+                select(DBFeed.etag, DBFeed.last_modified).where(DBFeed.url == url)
+            ).first()
+        headers = {}
+        if row and row.etag:
+            headers['If-None-Match'] = row.etag
+        if row and row.last_modified:
+            headers['If-Modified-Since'] = row.last_modified
+        return headers
+    
+    def _mark_unchanged(self, url: str) -> Optional[DBFeed]:
+        """Record a 304 Not Modified response: only the feed's last_updated changes"""
+        if self.debug:
+            logger.debug(f"Feed not modified: {url}")
+        db = SessionLocal(expire_on_commit=False)
+        try:
+            feed = db.query(DBFeed).filter(DBFeed.url == url).first()
+            if feed:
+                feed.last_updated = datetime.now(tzutc())
+                db.commit()
+            return feed
+        except Exception as e:
+            logger.error(f"Database error: {str(e)}")
+            db.rollback()
+            return None
+        finally:
+            db.close()
+    
+    def _process_feed(self, url: str, body: bytes, etag: Optional[str] = None,
+                      last_modified: Optional[str] = None,
+                      content_type: Optional[str] = None) -> Optional[DBFeed]:
+        """Parse a downloaded feed document and store the feed, its cache validators and its new entries"""
+        if body:
+            # Hand feedparser the raw bytes and the HTTP content type so it detects and
+            # decodes the encoding in one pass (its header lookup expects lower-case keys)
+            feed_data = feedparser.parse(
+                body, response_headers={'content-type': content_type or 'application/rss+xml'}
+            )
+        else:
+            # Nothing was downloaded; let feedparser try fetching the URL itself
+            feed_data = feedparser.parse(url)
+        
+        # A charset header that disagrees with the document, or a non-XML content type
+        # (feeds served as text/html, text/plain, ...), is recovered from, not fatal
+        error = feed_data.get('bozo_exception')
+        recoverable = (feedparser.CharacterEncodingOverride, feedparser.NonXMLContentType)
+        if not feed_data.feed or (error and not isinstance(error, recoverable)):
+            logger.error(f"Could not fetch feed from {url}: {error or 'No feed data'}")
+            return None
             
-            # Force UTF-8 encoding
-            content = response.content.decode('utf-8', errors='replace')
+        # Get feed description from multiple possible fields
+        description = (
+            feed_data.feed.get('description') or 
+            feed_data.feed.get('subtitle') or 
+            feed_data.feed.get('summary') or 
+            feed_data.feed.get('tagline') or
+            ''
+        )
+        
+        if self.debug:
+            logger.debug(f"Feed description: {description}")
             
-            # Parse the content with feedparser
-            feed_data = feedparser.parse(content)
+        # Opened directly rather than through a context manager: this runs once per
+        # fetched feed, hundreds of times during a bulk fetch or OPML import.
+        # Attributes aren't expired on commit, so the returned feed stays readable after close
+        db = SessionLocal(expire_on_commit=False)
+        try:
+            # Check if feed already exists
+            existing_feed = db.query(DBFeed).filter(DBFeed.url == url).first()
+            current_time = datetime.now(tzutc())
+            name = feed_data.feed.get('title', '')  # RSS feed title as name
+            # Get category from feeds.json
+            category = get_category_by_url(url)
             
-            if not feed_data.feed or hasattr(feed_data, 'bozo_exception'):
-                # If failed with direct content, try URL-based parsing as fallback
-                feed_data = feedparser.parse(url)
-                if not feed_data.feed or hasattr(feed_data, 'bozo_exception'):
-                    logger.error(f"Could not fetch feed from {url}: {getattr(feed_data, 'bozo_exception', 'No feed data')}")
-                    return None
-                
-            # Get feed description from multiple possible fields
-            description = (
-                feed_data.feed.get('description') or 
-                feed_data.feed.get('subtitle') or 
-                feed_data.feed.get('summary') or 
-                feed_data.feed.get('tagline') or
-                ''
-            )
+            if existing_feed:
+                if self.debug:
+                    logger.debug(f"Feed already exists: {url}")
+                # Update the feed name, description and last_updated
+                if (existing_feed.embedding is None or existing_feed.name != name
+                        or existing_feed.description != description):
+                    existing_feed.embedding = self._embed_feed(name, description)
+                existing_feed.name = name
+                existing_feed.description = description
+                existing_feed.last_updated = current_time
+                # Cleared until this fetch's entries are stored, so a failed run isn't answered with a 304 next time
+                existing_feed.etag = None
+                existing_feed.last_modified = None
+                if category:
+                    existing_feed.category = category
+                db.commit()
+                feed = existing_feed
+            else:
+                # Create new feed
+                feed = DBFeed(
+                    url=url,
+                    name=name,
+                    description=description,
+                    last_updated=current_time,
+                    category=category,
+                    embedding=self._embed_feed(name, description)
+                )
+                db.add(feed)
+                db.flush()
+
+            cutoff_time = current_time - timedelta(hours=self.max_age_hours)
             
             if self.debug:
-                logger.debug(f"Feed description: {description}")
-                
-            with get_db_session() as db:
-                try:
-                    # Check if feed already exists
-                    existing_feed = db.query(DBFeed).filter(DBFeed.url == url).first()
-                    current_time = datetime.now(tzutc())
+                logger.debug(f"Found {len(feed_data.entries)} entries")
+                logger.debug(f"Cutoff time: {cutoff_time}")
+                logger.debug(f"Max entries: {self.max_entries}")
+                logger.debug(f"Max age hours: {self.max_age_hours}")
+            
+            # Look up which of this fetch's links are already stored in one query;
+            # links accepted below are added so repeats within the feed are skipped too
+            feed_links = {entry.get('link') for entry in feed_data.entries if entry.get('link')}
+            seen_links = set(db.scalars(
+                select(FeedEntry.link).where(FeedEntry.feed_id == feed.id, FeedEntry.link.in_(feed_links))
+            )) if feed_links else set()
+            
+            # New entries are collected first and embedded in one batch after the loop
+            pending = []
+            # Read once rather than on every entry
+            debug = self.debug
+            assume_sorted = config.rss.assume_sorted
+            
+            # Process entries in order (feedparser usually returns newest first)
+            for position, entry in enumerate(feed_data.entries):
+                # Stop if we've reached the maximum number of entries
+                if self.entries_added + len(pending) >= self.max_entries:
+                    if debug:
+                        logger.debug(f"Reached maximum entries limit ({self.max_entries}), stopping")
+                    break
                     
-                    if existing_feed:
-                        if self.debug:
-                            logger.debug(f"Feed already exists: {url}")
-                        # Update the feed name, description and last_updated
-                        existing_feed.name = feed_data.feed.get('title', '')  # RSS feed title as name
-                        existing_feed.description = description
-                        existing_feed.last_updated = current_time
-                        # Get category from feeds.json
-                        if not FEED_CATEGORIES:
-                            _load_feeds()
-                        for cat, feeds in FEED_CATEGORIES.items():
-                            if any(f.url == url for f in feeds):
-                                existing_feed.category = cat
-                                break
-                        db.commit()
-                        feed = db.merge(existing_feed)
-                    else:
-                        # Create new feed
-                        if not FEED_CATEGORIES:
-                            _load_feeds()
-                        category = next((cat for cat, feeds in FEED_CATEGORIES.items() 
-                                      if any(f.url == url for f in feeds)), None)
-                        feed = DBFeed(
-                            url=url,
-                            name=feed_data.feed.get('title', ''),  # RSS feed title as name
-                            description=description,
-                            last_updated=current_time,
-                            category=category
-                        )
-                        db.add(feed)
-                        db.flush()
-
-                    cutoff_time = current_time - timedelta(hours=self.max_age_hours)
+                try:
+                    # Reject incomplete entries before any date parsing
+                    content = entry.get('content', [{}])[0].get('value', '') or entry.get('description', '')
+                    title = entry.get('title', '')
+                    link = entry.get('link', '')
                     
-                    if self.debug:
-                        logger.debug(f"Found {len(feed_data.entries)} entries")
-                        logger.debug(f"Cutoff time: {cutoff_time}")
-                        logger.debug(f"Max entries: {self.max_entries}")
-                        logger.debug(f"Max age hours: {self.max_age_hours}")
+                    if not title or not content or not link:
+                        if debug:
+                            logger.debug(f"Skipping entry: missing title, content, or link")
+                        self.entries_skipped += 1
+                        continue
                     
-                    # Process entries in order (feedparser usually returns newest first)
-                    for entry in feed_data.entries:
-                        # Stop if we've reached the maximum number of entries
-                        if self.entries_added >= self.max_entries:
-                            if self.debug:
-                                logger.debug(f"Reached maximum entries limit ({self.max_entries}), stopping")
-                            break
-                            
+                    # Parse published date to check time limit
+                    published = entry.get('published', entry.get('updated', entry.get('created')))
+                    # feedparser has already parsed the dates it recognizes into UTC struct_time
+                    published_parsed = (entry.get('published_parsed') or entry.get('updated_parsed')
+                                        or entry.get('created_parsed'))
+                    if published_parsed:
+                        # Clamp leap seconds, which struct_time allows but datetime does not
+                        published_date = datetime(*published_parsed[:5], min(published_parsed[5], 59), tzinfo=tzutc())
+                    elif published:
                         try:
-                            # Parse published date first to check time limit
-                            published = entry.get('published', entry.get('updated', entry.get('created')))
-                            if published:
-                                try:
-                                    # First try to parse with timezone info
-                                    published_date = parse(published, tzinfos=TZINFOS)
-                                    # If no timezone info was found, assume UTC
-                                    if published_date.tzinfo is None:
-                                        published_date = published_date.replace(tzinfo=tzutc())
-                                    # Convert to UTC for consistent comparison
-                                    published_date = published_date.astimezone(tzutc())
-                                except Exception as e:
-                                    if self.debug:
-                                        logger.warning(f"Error parsing date '{published}': {str(e)}")
-                                    published_date = current_time
-                            else:
-                                if self.debug:
-                                    logger.debug("No published date found, using current time")
-                                published_date = current_time
-                            
-                            # Skip entries older than cutoff time
-                            if published_date < cutoff_time:
-                                if self.debug:
-                                    logger.debug(f"Skipping entry: older than {self.max_age_hours} hours (published: {published_date}, cutoff: {cutoff_time})")
-                                self.entries_skipped += 1
-                                continue
-                            
-                            content = entry.get('content', [{}])[0].get('value', '') or entry.get('description', '')
-                            title = entry.get('title', '')
-                            link = entry.get('link', '')
-                            
-                            if not title or not content or not link:
-                                if self.debug:
-                                    logger.debug(f"Skipping entry: missing title, content, or link")
-                                self.entries_skipped += 1
-                                continue
-                            
-                            # Check if entry already exists
-                            existing_entry = db.query(FeedEntry).filter(
-                                FeedEntry.feed_id == feed.id,
-                                FeedEntry.link == link
-                            ).first()
-                            
-                            if existing_entry:
-                                if self.debug:
-                                    logger.debug(f"Skipping duplicate entry: {title}")
-                                self.entries_skipped += 1
-                                continue
-                                    
-                            try:
-                                embedding = self.embeddings.embed_query(f"{title} {content}")
-                            except Exception as e:
-                                logger.error(f"Error generating embedding for entry {title}: {str(e)}")
-                                self.entries_skipped += 1
-                                continue
-                            
-                            feed_entry = FeedEntry(
-                                feed_id=feed.id,
-                                title=title,
-                                content=content,
-                                link=link,
-                                published_date=published_date,
-                                embedding=embedding
-                            )
-                            
-                            db.add(feed_entry)
-                            self.entries_added += 1
-                            
-                            if self.debug:
-                                logger.debug(f"Added entry: {title} (published: {published_date})")
-                                
-                        except Exception as e:
-                            logger.error(f"Error processing entry: {str(e)}")
-                            self.entries_skipped += 1
-                            continue
-                    
-                    db.commit()
+                            published_date = _parse_date(published)
+                        except (ValueError, OverflowError) as e:
+                            # dateutil's ParserError is a ValueError; only unparseable dates land here
+                            if debug:
+                                logger.warning(f"Error parsing date '{published}': {str(e)}")
+                            published_date = current_time
+                    else:
+                        if debug:
+                            logger.debug("No published date found, using current time")
+                        published_date = current_time
                     
-                    if self.debug:
-                        logger.debug(f"Added {self.entries_added} entries, skipped {self.entries_skipped} entries")
+                    # Skip entries older than cutoff time
+                    if published_date < cutoff_time:
+                        if assume_sorted:
+                            # Newest-first feed: everything from here on is older still
+                            if debug:
+                                logger.debug(f"Stopping at entry older than {self.max_age_hours} hours (published: {published_date}, cutoff: {cutoff_time})")
+                            self.entries_skipped += len(feed_data.entries) - position
+                            break
+                        if debug:
+                            logger.debug(f"Skipping entry: older than {self.max_age_hours} hours (published: {published_date}, cutoff: {cutoff_time})")
+                        self.entries_skipped += 1
+                        continue
                     
-                    return feed
+                    # Check if entry already exists, in the database or earlier in this feed
+                    if link in seen_links:
+                        if debug:
+                            logger.debug(f"Skipping duplicate entry: {title}")
+                        self.entries_skipped += 1
+                        continue
                     
+                    pending.append((title, content, link, published_date))
+                    seen_links.add(link)
+                        
                 except Exception as e:
-                    logger.error(f"Database error: {str(e)}")
-                    db.rollback()
-                    return None
-                    
+                    logger.error(f"Error processing entry: {str(e)}")
+                    self.entries_skipped += 1
+                    continue
+            
+            texts = [f"{title} {content}" for title, content, _, _ in pending]
+            hashes = [_content_hash(entry_text) for entry_text in texts]
+            embeddings = self._embed_entries_cached(db, texts, hashes)
+            rows = []
+            for (title, content, link, published_date), content_hash, embedding in zip(pending, hashes, embeddings):
+                if embedding is None:
+                    self.entries_skipped += 1
+                    continue
+                
+                rows.append({
+                    'feed_id': feed.id,
+                    'title': title,
+                    'content': content,
+                    'content_preview': content[:200] + "..." if len(content) > 200 else content,
+                    'link': link,
+                    'published_date': published_date,
+                    'content_hash': content_hash,
+                    'embedding': embedding,
+                })
+                
+                if self.debug:
+                    logger.debug(f"Adding entry: {title} (published: {published_date})")
+            
+            if rows:
+                # One multi-row INSERT; rows stored by a concurrent fetch since the lookup
+                # above are dropped by the unique (feed_id, link) constraint instead of
+                # failing the whole batch
+                result = db.execute(
+                    pg_insert(FeedEntry).values(rows)
+                    .on_conflict_do_nothing(index_elements=['feed_id', 'link'])
+                )
+                self.entries_added += result.rowcount
+                self.entries_skipped += len(rows) - result.rowcount
+            # Keep the validators only when every new entry was stored; otherwise the
+            # next fetch downloads the feed again and retries the missing entries
+            if len(rows) == len(pending):
+                feed.etag = etag
+                feed.last_modified = last_modified
+            db.commit()
+            
+            if self.debug:
+                logger.debug(f"Added {self.entries_added} entries, skipped {self.entries_skipped} entries")
+            
+            return feed
+            
         except Exception as e:
-            logger.error(f"Error fetching feed: {str(e)}")
+            logger.error(f"Database error: {str(e)}")
+            db.rollback()
+            return None
+        finally:
+            db.close()
+                
+        
+    def _embed_entries_cached(self, db, texts: List[str], hashes: List[str]) -> List[Optional[List[float]]]:
+        """Embed entry texts, reusing stored embeddings of entries with the same content hash"""
+        if not texts:
+            return []
+        # One lookup for every hash; entries repeated across feeds or re-linked are not re-embedded
+        known = dict(db.execute(
+            select(FeedEntry.content_hash, FeedEntry.embedding)
+            .where(FeedEntry.content_hash.in_(set(hashes)), FeedEntry.embedding.is_not(None))
+        ).all())
+        # Texts repeated within this fetch are embedded once
+        missing = {h: entry_text for entry_text, h in zip(texts, hashes) if h not in known}
+        if missing:
+            known.update(zip(missing, self._embed_entries(list(missing.values()))))
+        if self.debug:
+            logger.debug(f"Embedded {len(missing)} of {len(texts)} entries, reusing the rest")
+        return [known[h] for h in hashes]
+    
+    def _embed_entries(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Embed entry texts in batches of embed_batch_size, one request per batch"""
+        batch_size = max(1, config.ollama.embed_batch_size)
+        embeddings = []
+        for start in range(0, len(texts), batch_size):
+            embeddings.extend(self._embed_batch(texts[start:start + batch_size]))
+        return embeddings
+    
+    def _embed_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Embed texts in one request, falling back to one request per text if the batch fails"""
+        try:
+            return self.embeddings.embed_documents(texts)
+        except Exception as e:
+            logger.error(f"Error generating embeddings for {len(texts)} entries, retrying one by one: {str(e)}")
+        
+        embeddings = []
+        for entry_text in texts:
+            try:
+                embeddings.append(self.embeddings.embed_query(entry_text))
+            except Exception as e:
+                logger.error(f"Error generating embedding for entry {entry_text[:80]}: {str(e)}")
+                embeddings.append(None)
+        return embeddings
+    
+    def _embed_feed(self, name: str, description: str) -> Optional[List[float]]:
+        """Embed a feed's name and description, or return None if embedding fails"""
+        try:
+            return self.embeddings.embed_query(f"{name} {description}")
+        except Exception as e:
+            logger.error(f"Error generating embedding for feed {name}: {str(e)}")
             return None
+    
+    def search_similar_feeds(self, query: str, limit: int = 5, ef_search: int = 40) -> List[DBFeed]:
+        """
+        Search for feeds whose name and description are closest to the query using the HNSW index
+        
+        Args:
+            query: The search query
+            limit: Maximum number of feeds to return
+            ef_search: HNSW ef_search parameter (higher values = more accurate but slower)
+            
+        Returns:
+            List of DBFeed objects ordered by similarity
+        """
+        try:
+            query_embedding = list(_embed_query_cached(query))
+            
+            with get_read_session() as db:
+                db.execute(text("SET LOCAL hnsw.ef_search = :ef_search"), {"ef_search": ef_search})
+                return db.query(DBFeed).filter(
+                    DBFeed.embedding.isnot(None)
+                ).order_by(
+                    DBFeed.embedding.l2_distance(query_embedding)
+                ).limit(limit).all()
+                
+        except Exception as e:
+            logger.error(f"Error in search_similar_feeds: {str(e)}")
+            return []
         
     def search_similar_entries(self, query: str, limit: int = 5, ef_search: int = 40) -> List[FeedEntry]:
         """
@@ -250,42 +488,30 @@ class RSSFetcher:
             ef_search: HNSW ef_search parameter (higher values = more accurate but slower)
             
         Returns:
-            List of similar FeedEntry objects
+            List of similar FeedEntry objects (content and embedding are not loaded)
         """
         try:
             # Generate embedding for the query
-            query_embedding = self.embeddings.embed_query(query)
+            query_embedding = list(_embed_query_cached(query))
             
-            with get_db_session() as db:
+            with get_read_session() as db:
                 try:
                     # Set ef_search parameter for this query
                     db.execute(text("SET LOCAL hnsw.ef_search = :ef_search"), {"ef_search": ef_search})
                     
-                    # Using HNSW index for approximate nearest neighbor search
-                    # We get more results initially to allow for post-filtering
-                    initial_limit = limit * 3
-                    results = db.query(FeedEntry).order_by(
+                    # Using HNSW index for approximate nearest neighbor search; the stored
+                    # entry embeddings already rank candidates, so no re-ranking pass follows
+                    # Callers only need previews, so leave the full content and vector in the database
+                    results = db.query(FeedEntry).options(
+                        defer(FeedEntry.content), defer(FeedEntry.embedding)
+                    ).order_by(
                         FeedEntry.embedding.l2_distance(query_embedding)
-                    ).limit(initial_limit).all()
+                    ).limit(limit).all()
                     
                     if not results:
                         logger.debug(f"No results found for query: {query}")
-                        return []
-                    
-                    # Post-process results to improve relevance
-                    processed_results = []
-                    for entry in results:
-                        # Calculate semantic similarity score
-                        title_embedding = self.embeddings.embed_query(entry.title)
-                        similarity = 1.0 / (1.0 + sum((a - b) ** 2 for a, b in zip(query_embedding, title_embedding)) ** 0.5)
-                        
-                        processed_results.append((entry, similarity))
-                    
-                    # Sort by similarity score and take top results
-                    processed_results.sort(key=lambda x: x[1], reverse=True)
                     
-                    # Return only the entries, discarding scores
-                    return [entry for entry, _ in processed_results[:limit]]
+                    return results
                     
                 except Exception as e:
                     logger.error(f"Database error in search_similar_entries: {str(e)}")